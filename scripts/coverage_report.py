@@ -16,41 +16,65 @@ Example usage (run from repo root):
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+import posixpath
 from dataclasses import dataclass
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
+try:
+    # Optional: stream file entries instead of loading the whole report.
+    import ijson
+except ModuleNotFoundError:
+    _HAS_IJSON = False
+else:
+    _HAS_IJSON = True
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 DEFAULT_REPORT = Path("tarpaulin-report.json")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CoverageEntry:
     coverage: float
     coverable: int
     covered: int
-    path: Path
+    path: str  # POSIX-style path as reported by Tarpaulin
 
-    def format(self, relative_to: Path | None = None) -> str:
-        display_path = self.relative_path(relative_to)
-        return f"{self.coverage:6.2f}%  {display_path}"
+    def format(self, root: str = "") -> str:
+        return f"{self.coverage:6.2f}%  {self.relative_path(root)}"
 
-    def relative_path(self, relative_to: Path | None) -> Path:
-        if relative_to is None:
-            return self.path
-        try:
-            return self.path.relative_to(relative_to)
-        except ValueError:
-            return self.path
+    def relative_path(self, root: str) -> str:
+        # `root` is a POSIX directory prefix ending in "/"; plain string stripping
+        # avoids Path construction and exception handling per entry.
+        return self.path.removeprefix(root)
+
+
+def _non_negative_int(value: str) -> int:
+    """Parse a command-line count that must be zero or greater."""
+    try:
+        count = int(value)
+    except ValueError:
+        msg = f"invalid int value: {value!r}"
+        raise argparse.ArgumentTypeError(msg) from None
+    if count < 0:
+        msg = f"must be 0 or greater, got {count}"
+        raise argparse.ArgumentTypeError(msg)
+    return count
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     """
     Parse command-line options for summarizing Tarpaulin coverage data.
 
+    Args:
+        argv (list[str] | None): Arguments to parse; defaults to ``sys.argv[1:]``.
+
     Returns:
         argparse.Namespace: Parsed arguments including report path, prefix filter,
             result limit, and sort order flag.
@@ -69,7 +93,7 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--limit",
-        type=int,
+        type=_non_negative_int,
         default=None,
         help="Limit output to the N lowest-covered entries.",
     )
@@ -78,45 +102,68 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Sort in descending order (default: ascending).",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def load_report(report_path: Path) -> dict[str, Any]:
+def iter_file_entries(report_path: Path) -> Iterator[dict[str, Any]]:
     """
-    Load and parse the Tarpaulin coverage report from disk.
+    Iterate over the per-file entries of a Tarpaulin coverage report.
+
+    When `ijson` is installed the report is parsed incrementally, so only one
+    file entry is held in memory at a time. Otherwise the report is loaded with
+    the standard library `json` module.
 
     Args:
         report_path (Path): Path to the Tarpaulin JSON coverage report.
 
-    Returns:
-        dict[str, Any]: Parsed JSON payload describing coverage information.
+    Yields:
+        dict[str, Any]: Raw JSON object for each entry in the report's `files` array.
 
     Raises:
-        SystemExit: If the report file does not exist.
+        SystemExit: If the report file does not exist, is not valid JSON, or its
+            root is not a JSON object.
     """
     if not report_path.is_file():
         raise SystemExit(f"Coverage report not found: {report_path}")
 
+    if _HAS_IJSON:
+        with report_path.open("rb") as handle:
+            try:
+                events = ijson.parse(handle, use_float=True)
+                first = next(events)
+                if first[1] != "start_map":
+                    raise SystemExit(f"Coverage report root must be a JSON object: {report_path}")
+                for entry in ijson.items(chain((first,), events), "files.item"):
+                    if isinstance(entry, dict):
+                        yield cast("dict[str, Any]", entry)
+            except ijson.JSONError as exc:
+                raise SystemExit(f"Could not parse coverage report {report_path}: {exc}") from exc
+        return
+
     with report_path.open("r", encoding="utf-8") as handle:
-        data: object = json.load(handle)
+        try:
+            data: object = json.load(handle)
+        except json.JSONDecodeError as exc:
+            raise SystemExit(f"Could not parse coverage report {report_path}: {exc}") from exc
 
     if not isinstance(data, dict):
         raise SystemExit(f"Coverage report root must be a JSON object: {report_path}")
 
-    return cast("dict[str, Any]", data)
+    for entry in cast("dict[str, Any]", data).get("files", []):
+        if isinstance(entry, dict):
+            yield cast("dict[str, Any]", entry)
 
 
-def coverage_entries(data: dict) -> Iterable[CoverageEntry]:
+def coverage_entries(files: Iterable[dict[str, Any]]) -> Iterator[CoverageEntry]:
     """
-    Iterate over coverage entries extracted from Tarpaulin JSON data.
+    Iterate over coverage entries extracted from Tarpaulin file entries.
 
     Args:
-        data (dict): Parsed JSON representation of the Tarpaulin report.
+        files (Iterable[dict[str, Any]]): Raw file entries from the Tarpaulin report.
 
     Yields:
         CoverageEntry: Coverage details for each file with coverable lines.
     """
-    files = data.get("files", [])
     for entry in files:
         coverable = entry.get("coverable", 0)
         covered = entry.get("covered", 0)
@@ -125,7 +172,9 @@ def coverage_entries(data: dict) -> Iterable[CoverageEntry]:
         raw_path = entry.get("path")
         if not raw_path:
             continue
-        path = Path(*raw_path) if isinstance(raw_path, (list, tuple)) else Path(raw_path)
+        # Keep paths as POSIX strings; no Path object is needed to filter or print them.
+        path = posixpath.join(*map(str, raw_path)) if isinstance(raw_path, (list, tuple)) else str(raw_path)
+        path = path.replace("\\", "/")
         coverage = (covered / coverable) * 100
         yield CoverageEntry(coverage=coverage, coverable=coverable, covered=covered, path=path)
 
@@ -133,56 +182,60 @@ def coverage_entries(data: dict) -> Iterable[CoverageEntry]:
 def filter_entries(
     entries: Iterable[CoverageEntry],
     prefix: str,
-    relative_to: Path,
-) -> list[CoverageEntry]:
+    root: str,
+) -> Iterator[CoverageEntry]:
     """
     Reduce coverage entries to those matching a path prefix relative to the repo root.
 
     Args:
         entries (Iterable[CoverageEntry]): Coverage entries to filter.
         prefix (str): Path prefix to match against each entry.
-        relative_to (Path): Base directory used to compute relative paths.
+        root (str): POSIX repo root prefix (ending in "/") stripped to compute relative paths.
 
-    Returns:
-        List[CoverageEntry]: Entries whose relative paths start with the specified prefix.
+    Yields:
+        CoverageEntry: Entries whose relative paths start with the specified prefix.
     """
     if not prefix:
-        return list(entries)
-    normalized_prefix = prefix if prefix.endswith("/") else f"{prefix}/"
-    filtered: list[CoverageEntry] = []
+        yield from entries
+        return
+    segments = [segment for segment in prefix.replace("\\", "/").split("/") if segment]
+    leading = "/" if prefix.startswith(("/", "\\")) else ""
+    normalized_prefix = leading + "".join(f"{segment}/" for segment in segments)
     for entry in entries:
-        relative = entry.relative_path(relative_to)
-        relative_str = relative.as_posix()
-        if relative_str.startswith(normalized_prefix):
-            filtered.append(entry)
-    return filtered
+        if entry.relative_path(root).startswith(normalized_prefix):
+            yield entry
 
 
 def main() -> None:
     """
     Execute the coverage reporting workflow based on CLI arguments.
 
-    This function parses CLI arguments, loads coverage data, filters results,
+    This function parses CLI arguments, streams coverage data, filters results,
     and prints formatted output.
     """
     args = parse_args()
-    data = load_report(args.report)
 
     repo_root = Path(__file__).resolve().parent.parent
-    entries = list(coverage_entries(data))
-    filtered = filter_entries(entries, args.prefix, repo_root)
+    root = f"{repo_root.as_posix().rstrip('/')}/"
+    # Single lazy pipeline: report entries are parsed, filtered and selected without intermediate lists.
+    filtered = filter_entries(coverage_entries(iter_file_entries(args.report)), args.prefix, root)
 
-    if not filtered:
+    first = next(filtered, None)
+    if first is None:
         prefix_message = f" with prefix '{args.prefix}'" if args.prefix else ""
         print(f"No coverable files found{prefix_message}.")
         return
+    filtered = chain((first,), filtered)
 
-    sorted_entries = sorted(filtered, key=lambda item: item.coverage, reverse=args.descending)
     if args.limit is not None:
-        sorted_entries = sorted_entries[: args.limit]
+        # Bounded heap selection: O(M log N) instead of sorting every entry.
+        pick = heapq.nlargest if args.descending else heapq.nsmallest
+        sorted_entries = pick(args.limit, filtered, key=attrgetter("coverage"))
+    else:
+        sorted_entries = sorted(filtered, key=attrgetter("coverage"), reverse=args.descending)
 
     for entry in sorted_entries:
-        print(entry.format(relative_to=repo_root))
+        print(entry.format(root))
 
 
 if __name__ == "__main__":
@@ -7,17 +7,31 @@ Requires Python 3.11+ for PEP 604 union types and datetime.UTC.
 """
 
 import argparse
+import heapq
 import json
 import math
-import re
+import mmap
+import os
 import shutil
-import statistics
 import subprocess
 import sys
+from bisect import bisect_right
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter, mul
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, NotRequired, TypedDict, cast
 
+try:
+    # Optional: orjson parses bytes directly and is much faster than the stdlib decoder.
+    import orjson
+except ModuleNotFoundError:
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
 if TYPE_CHECKING:
     from subprocess_utils import ExecutableNotFoundError, run_cargo_command
 else:
@@ -37,6 +51,8 @@ class CriterionEstimate(TypedDict):
     timestamp: str
     mean_ci_lower: NotRequired[float]
     mean_ci_upper: NotRequired[float]
+    median_ci_lower: NotRequired[float]
+    median_ci_upper: NotRequired[float]
 
 
 class NewBenchmark(TypedDict):
@@ -73,7 +89,20 @@ class ComparisonResult(TypedDict):
     summary: ComparisonSummary | None
 
 
+class EstimatesCacheEntry(TypedDict):
+    mtime_ns: int
+    size: int
+    # CriterionEstimate fields other than the run-specific timestamp
+    result: dict[str, object]
+
+
 # --- Trend analysis types ---
+class TrendCacheEntry(TypedDict):
+    mtime_ns: int
+    size: int
+    means: dict[str, float]
+
+
 TrendDirection = Literal["improving", "degrading", "stable"]
 
 
@@ -99,11 +128,11 @@ class TrendAnalysisError(TypedDict):
 TrendAnalysisResult = TrendAnalysisSuccess | TrendAnalysisError
 
 
-# LoadedBaseline for trend analysis
+# LoadedBaseline for trend analysis; only the per-benchmark means are retained
 class LoadedBaseline(TypedDict):
     timestamp: datetime
     file: Path
-    data: dict[str, CriterionEstimate]
+    means: dict[str, float]
 
 
 _BASELINE_REQUIRED_KEYS: set[str] = {
@@ -114,7 +143,126 @@ _BASELINE_REQUIRED_KEYS: set[str] = {
     "timestamp",
 }
 _BASELINE_NUMERIC_KEYS: set[str] = {"mad_ns", "mean_ns", "median_ns", "std_dev_ns"}
-_BASELINE_OPTIONAL_NUMERIC_KEYS: set[str] = {"mean_ci_lower", "mean_ci_upper"}
+_BASELINE_OPTIONAL_NUMERIC_KEYS: set[str] = {"mean_ci_lower", "mean_ci_upper", "median_ci_lower", "median_ci_upper"}
+# Version of the {"_schema": ..., "entries": {...}} envelope written by save_baseline
+_BASELINE_SCHEMA_VERSION = 1
+
+# Criterion writes <group>/<function>/[<parameter>/]<run_type>/estimates.json (or
+# <benchmark>/<run_type>/... for ungrouped benchmarks); only "new" and "base" hold runs,
+# listed in order of preference.
+_CRITERION_RUN_TYPES: tuple[str, ...] = ("new", "base")
+_CRITERION_MAX_BENCHMARK_DEPTH = 3
+# Directories Criterion fills with HTML/SVG reports and change statistics, never run estimates
+_CRITERION_SKIP_DIRS: frozenset[str] = frozenset({"change", "report"})
+_ESTIMATES_CACHE_FILENAME = ".estimates_cache.json"
+_TREND_CACHE_FILENAME = ".trend_cache.json"
+# Below this size mapping a JSON file costs more than reading it into memory
+_MMAP_JSON_MIN_BYTES = 64 * 1024
+# Decoding holds the GIL, so threads beyond a handful only add contention
+_MAX_ESTIMATES_WORKERS = 8
+
+# Length of the trailing "YYYYMMDD_HHMMSS" of baseline_[<tag>_]<timestamp>.json filenames
+_BASELINE_TIMESTAMP_LEN = len("YYYYMMDD_HHMMSS")
+
+# (divisor, format) per unit; a value below _TIME_UNIT_THRESHOLDS[i] uses _TIME_UNITS[i]
+_TIME_UNIT_THRESHOLDS: tuple[float, ...] = (1_000, 1_000_000, 1_000_000_000)
+_TIME_UNITS: tuple[tuple[float, str], ...] = (
+    (1, "{:.1f}ns"),
+    (1_000, "{:.1f}µs"),
+    (1_000_000, "{:.1f}ms"),
+    (1_000_000_000, "{:.2f}s"),
+)
+
+
+def _format_ratio(numerator: float, denominator: float) -> str:
+    """Format a speed ratio for report tables, using ∞ for a zero or vanishing denominator."""
+    ratio = numerator / denominator if denominator != 0 else math.inf
+    return "∞" if math.isinf(ratio) else f"{ratio:.2f}"
+
+
+def _load_json(path: Path) -> object:
+    """Read and decode a JSON file, using orjson when it is installed.
+
+    Both decoders raise a subclass of json.JSONDecodeError on malformed input.
+    Large files are memory-mapped for orjson so their bytes are not copied first.
+    """
+    with path.open("rb") as handle:
+        if _HAS_ORJSON:
+            if os.fstat(handle.fileno()).st_size >= _MMAP_JSON_MIN_BYTES:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                    return orjson.loads(view)
+            return orjson.loads(handle.read())
+        return json.loads(handle.read())
+
+
+def _load_json_cache(cache_path: Path) -> dict[str, object]:
+    """Load a path-keyed JSON cache file, treating a missing or corrupt cache as empty."""
+    try:
+        data = _load_json(cache_path)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+
+    return cast("dict[str, object]", data)
+
+
+def _save_json_cache(cache_path: Path, cache: Mapping[str, object], *, description: str) -> None:
+    # Caches are an optimization only; failing to write one must not fail the run.
+    try:
+        _write_json(cache_path, cache)
+    except OSError as e:
+        print(f"Warning: Could not write {description}: {e}")
+
+
+def _cache_entry_is_current(cached: object, stat: os.stat_result) -> bool:
+    """Whether a cache entry was recorded for a file with the same mtime and size."""
+    return isinstance(cached, dict) and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size
+
+
+def _walk_criterion(results_dir: Path) -> Iterator[tuple[str, Path]]:
+    """Yield ``(benchmark_name, estimates.json path)`` for every benchmark in a Criterion results tree.
+
+    The benchmark name is the path between ``results_dir`` and the run directory,
+    e.g. ``action_calculations/calculate_action/50/base/estimates.json`` yields
+    ``"action_calculations/calculate_action/50"``.
+    """
+    pending: list[tuple[str, tuple[str, ...]]] = [(str(results_dir), ())]
+    while pending:
+        directory, name_parts = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = sorted((entry.name, entry.path) for entry in entries if entry.is_dir())
+        except OSError:
+            continue
+
+        subdir_names = {name for name, _ in subdirs}
+        if name_parts:
+            # Prefer the latest run ("new"); "base" is only a fallback when no new run exists
+            for run_type in _CRITERION_RUN_TYPES:
+                if run_type in subdir_names:
+                    estimates_path = Path(directory, run_type, "estimates.json")
+                    if estimates_path.is_file():
+                        yield "/".join(name_parts), estimates_path
+                        break
+
+        if len(name_parts) < _CRITERION_MAX_BENCHMARK_DEPTH:
+            # Reverse so the stack pops children in name order
+            pending.extend(
+                (path, (*name_parts, name))
+                for name, path in reversed(subdirs)
+                if name not in _CRITERION_SKIP_DIRS and name not in _CRITERION_RUN_TYPES
+            )
+
+
+def _write_json(path: Path, data: object, *, indent: bool = False, sort_keys: bool = False) -> None:
+    """Encode ``data`` as JSON and write it to ``path``, using orjson when it is installed."""
+    if _HAS_ORJSON:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        path.write_bytes(orjson.dumps(data, option=option or None))
+    else:
+        path.write_text(json.dumps(data, indent=2 if indent else None, sort_keys=sort_keys), encoding="utf-8")
 
 
 def _baseline_entry_validation_error(
@@ -156,25 +304,116 @@ def _baseline_entry_validation_error(
     return error
 
 
-def _validated_baseline_data(
+def _is_valid_baseline_entry(benchmark: object, estimate: object) -> bool:
+    """Same acceptance rule as _baseline_entry_validation_error, without building a message."""
+    return isinstance(benchmark, str) and _is_valid_estimate(estimate)
+
+
+def _is_valid_estimate(estimate: object) -> bool:
+    """Check that an estimate has the required numeric fields, a timestamp and numeric intervals if present."""
+    if not isinstance(estimate, dict):
+        return False
+
+    get = cast("dict[str, object]", estimate).get
+    return (
+        isinstance(get("mean_ns"), (int, float))
+        and isinstance(get("std_dev_ns"), (int, float))
+        and isinstance(get("median_ns"), (int, float))
+        and isinstance(get("mad_ns"), (int, float))
+        and isinstance(get("timestamp"), str)
+        and isinstance(get("mean_ci_lower", 0.0), (int, float))
+        and isinstance(get("mean_ci_upper", 0.0), (int, float))
+        and isinstance(get("median_ci_lower", 0.0), (int, float))
+        and isinstance(get("median_ci_upper", 0.0), (int, float))
+    )
+
+
+def _check_baseline_data(
     data: object,
     *,
     baseline_path: Path,
-) -> dict[str, CriterionEstimate] | None:
+) -> tuple[dict[str, CriterionEstimate] | None, str | None]:
+    """Validate decoded baseline data, returning the entries or None plus any warning to print."""
     if not isinstance(data, dict):
-        return None
+        return None, None
 
+    # Baselines written by save_baseline carry a schema marker; their entries were
+    # produced by extract_criterion_results and are trusted without per-entry checks.
+    if data.get("_schema") == _BASELINE_SCHEMA_VERSION:
+        entries = data.get("entries")
+        return (cast("dict[str, CriterionEstimate]", entries) if isinstance(entries, dict) else None), None
+
+    # Older baselines are a flat {benchmark: estimate} mapping and are validated entry by entry
     for benchmark, estimate in data.items():
+        # Well-formed entries take the cheap check; only a failing entry builds the detailed warning
+        if _is_valid_baseline_entry(benchmark, estimate):
+            continue
+
         error = _baseline_entry_validation_error(
             benchmark,
             estimate,
             baseline_path=baseline_path,
         )
         if error is not None:
-            print(error)
-            return None
+            return None, error
+
+    return cast("dict[str, CriterionEstimate]", data), None
+
+
+def _validated_baseline_data(
+    data: object,
+    *,
+    baseline_path: Path,
+) -> dict[str, CriterionEstimate] | None:
+    validated, error = _check_baseline_data(data, baseline_path=baseline_path)
+    if error is not None:
+        print(error)
+    return validated
+
+
+@lru_cache(maxsize=32)
+def _load_baseline_cached(path: str, mtime_ns: int, size: int) -> tuple[dict[str, CriterionEstimate] | None, str | None]:
+    """Decode and validate a baseline file, returning the entries and any validation warning.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so a rewritten
+    file is loaded again. Decode errors propagate and are not cached. The
+    warning is returned rather than printed so every load of an invalid file
+    reports it, not just the first.
+    """
+    baseline_path = Path(path)
+    return _check_baseline_data(_load_json(baseline_path), baseline_path=baseline_path)
+
+
+def _ordered_changes(changes: list[BenchmarkChange], top: int | None, *, largest_first: bool) -> list[BenchmarkChange]:
+    """Order changes by change_percent, keeping only the first ``top`` when it is set.
+
+    Regressions are listed with ``largest_first=True`` and improvements with
+    ``largest_first=False``: with a non-negative threshold every improvement has a
+    negative change_percent, so ascending order puts the largest improvement first
+    without an abs() in the sort key. A bounded heap selection avoids sorting every
+    change when only a few are shown.
+    """
+    key = itemgetter("change_percent")
+    if top:
+        return heapq.nlargest(top, changes, key=key) if largest_first else heapq.nsmallest(top, changes, key=key)
+    return sorted(changes, key=key, reverse=largest_first)
+
 
-    return cast("dict[str, CriterionEstimate]", data)
+def _confidence_intervals_overlap(current: CriterionEstimate, baseline: CriterionEstimate) -> bool:
+    """Whether both estimates carry median confidence intervals and those intervals overlap.
+
+    Changes are measured on the median, so the noise gate uses the median's interval
+    too; outliers that widen the mean's interval must not hide a median regression.
+    """
+    current_lower = current.get("median_ci_lower")
+    current_upper = current.get("median_ci_upper")
+    baseline_lower = baseline.get("median_ci_lower")
+    baseline_upper = baseline.get("median_ci_upper")
+    if current_lower is None or current_upper is None or baseline_lower is None or baseline_upper is None:
+        # Without both intervals there is no noise estimate; fall back to the threshold alone
+        return False
+
+    return current_lower <= baseline_upper and baseline_lower <= current_upper
 
 
 class PerformanceAnalyzer:
@@ -187,11 +426,17 @@ class PerformanceAnalyzer:
         self.reports_dir = project_root / "performance_reports"
 
         # Ensure directories exist
-        self.baseline_dir.mkdir(exist_ok=True)
-        self.reports_dir.mkdir(exist_ok=True)
+        self.baseline_dir.mkdir(parents=True, exist_ok=True)
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+
+    def run_benchmarks(self, verbose: bool = False) -> bool:
+        """Run cargo bench and return success status.
 
-    def run_benchmarks(self) -> bool:
-        """Run cargo bench and return success status."""
+        Cargo's JSON stdout is discarded (or shown when ``verbose``) rather than
+        buffered, since results are read from the Criterion output directory.
+        stderr is captured for the failure message unless ``verbose`` is set, in
+        which case both streams go straight to the terminal.
+        """
         print("🏃 Running benchmarks...")
         try:
             result = run_cargo_command(
@@ -199,11 +444,15 @@ class PerformanceAnalyzer:
                 cwd=self.project_root,
                 check=False,
                 timeout=600,  # 10 minute timeout
+                capture_output=False,
+                stdout=None if verbose else subprocess.DEVNULL,
+                stderr=None if verbose else subprocess.PIPE,
             )
 
             if result.returncode != 0:
                 print("❌ Benchmark execution failed:")
-                print(result.stderr)
+                if result.stderr:
+                    print(result.stderr)
                 return False
 
             print("✅ Benchmarks completed successfully")
@@ -224,81 +473,167 @@ class PerformanceAnalyzer:
         data_dict: dict[str, object],
         estimate: CriterionEstimate,
     ) -> None:
-        """Extract confidence intervals from mean section if available."""
-        mean_section = data_dict.get("mean")
-        if not isinstance(mean_section, dict):
-            return
+        """Extract the mean and median confidence intervals if available."""
+        interval_bounds = PerformanceAnalyzer._get_interval_bounds
 
-        mean_dict = cast("dict[str, object]", mean_section)
-        mean_ci = mean_dict.get("confidence_interval")
-        if not isinstance(mean_ci, dict):
-            return
+        lower, upper = interval_bounds(data_dict, "mean")
+        if lower is not None:
+            estimate["mean_ci_lower"] = lower
+        if upper is not None:
+            estimate["mean_ci_upper"] = upper
+
+        lower, upper = interval_bounds(data_dict, "median")
+        if lower is not None:
+            estimate["median_ci_lower"] = lower
+        if upper is not None:
+            estimate["median_ci_upper"] = upper
+
+    @staticmethod
+    def _get_interval_bounds(data: dict[str, object], section_name: str) -> tuple[float | None, float | None]:
+        """Return the confidence interval bounds of ``data[section_name]``, None where missing."""
+        section = data.get(section_name)
+        if not isinstance(section, dict):
+            return None, None
+
+        interval = cast("dict[str, object]", section).get("confidence_interval")
+        if not isinstance(interval, dict):
+            return None, None
+
+        interval_dict = cast("dict[str, object]", interval)
+        lower = interval_dict.get("lower_bound")
+        upper = interval_dict.get("upper_bound")
+        return (
+            float(lower) if isinstance(lower, (int, float)) else None,
+            float(upper) if isinstance(upper, (int, float)) else None,
+        )
+
+    @staticmethod
+    def _get_point_estimate(data: dict[str, object], section_name: str) -> float:
+        """Return ``data[section_name]["point_estimate"]`` as a float, or 0.0 if it is missing."""
+        section = data.get(section_name)
+        if not isinstance(section, dict):
+            return 0.0
+
+        section_dict = cast("dict[str, object]", section)
+        point_estimate = section_dict.get("point_estimate")
+        return float(point_estimate) if isinstance(point_estimate, (int, float)) else 0.0
+
+    @staticmethod
+    def _parse_estimates_file(estimates_file: Path, timestamp: str) -> CriterionEstimate | None:
+        """Parse a Criterion estimates.json file into a CriterionEstimate stamped with ``timestamp``."""
+        data = _load_json(estimates_file)
+
+        if not isinstance(data, dict):
+            return None
+
+        data_dict = cast("dict[str, object]", data)
+        point_estimate = PerformanceAnalyzer._get_point_estimate
 
-        mean_ci_dict = cast("dict[str, object]", mean_ci)
+        estimate: CriterionEstimate = {
+            "mean_ns": point_estimate(data_dict, "mean"),
+            "std_dev_ns": point_estimate(data_dict, "std_dev"),
+            "median_ns": point_estimate(data_dict, "median"),
+            "mad_ns": point_estimate(data_dict, "median_abs_dev"),
+            "timestamp": timestamp,
+        }
+
+        # Add confidence intervals if available
+        PerformanceAnalyzer._extract_confidence_intervals(data_dict, estimate)
+        return estimate
+
+    def _estimates_cache_path(self) -> Path:
+        return self.reports_dir / _ESTIMATES_CACHE_FILENAME
+
+    def _load_estimates_cache(self) -> dict[str, EstimatesCacheEntry]:
+        """Load the estimates.json parse cache, ignoring missing or corrupt caches."""
+        return cast("dict[str, EstimatesCacheEntry]", _load_json_cache(self._estimates_cache_path()))
+
+    def _save_estimates_cache(self, cache: dict[str, EstimatesCacheEntry]) -> None:
+        _save_json_cache(self._estimates_cache_path(), cache, description="estimates cache")
+
+    @staticmethod
+    def _cached_estimate(cached: object, stat: os.stat_result, timestamp: str) -> CriterionEstimate | None:
+        """Return the cached estimate if it is still valid for a file with the given stat."""
+        if not _cache_entry_is_current(cached, stat):
+            return None
+
+        result = cast("dict[str, object]", cached).get("result")
+        if not isinstance(result, dict):
+            return None
 
-        lower = mean_ci_dict.get("lower_bound")
-        if isinstance(lower, (int, float)):
-            estimate["mean_ci_lower"] = float(lower)
+        # Entries cached before median intervals were recorded have only the mean's; re-parse those
+        if ("mean_ci_lower" in result) != ("median_ci_lower" in result):
+            return None
 
-        upper = mean_ci_dict.get("upper_bound")
-        if isinstance(upper, (int, float)):
-            estimate["mean_ci_upper"] = float(upper)
+        estimate = {**result, "timestamp": timestamp}
+        if not _is_valid_estimate(estimate):
+            return None
+
+        return cast("CriterionEstimate", estimate)
+
+    def _read_estimates(
+        self,
+        estimates_file: Path,
+        cached: object,
+        timestamp: str,
+    ) -> tuple[CriterionEstimate | None, os.stat_result]:
+        """Return the estimate for one estimates.json file, preferring a still-valid cache entry."""
+        stat = estimates_file.stat()
+        estimate = self._cached_estimate(cached, stat, timestamp)
+        if estimate is None:
+            estimate = self._parse_estimates_file(estimates_file, timestamp)
+        return estimate, stat
 
     def extract_criterion_results(self) -> dict[str, CriterionEstimate]:
-        """Extract benchmark results from criterion output directory."""
+        """Extract benchmark results from criterion output directory.
+
+        Parsed estimates are cached in the reports directory, keyed by file path,
+        modification time and size, so unchanged estimates.json files are not
+        re-parsed on subsequent runs. Files are read on a thread pool so that
+        filesystem latency overlaps with decoding.
+        """
         results: dict[str, CriterionEstimate] = {}
 
         if not self.results_dir.exists():
             print(f"Warning: Criterion results directory not found: {self.results_dir}")
             return results
 
-        # Recursively find all estimates.json files (Criterion writes current runs to "new")
-        for estimates_file in self.results_dir.rglob("estimates.json"):
-            if estimates_file.parent.name not in {"new", "base"}:
-                continue
-            try:
-                with open(estimates_file, encoding="utf-8") as f:
-                    data = json.load(f)
+        cache = self._load_estimates_cache()
+        updated_cache: dict[str, EstimatesCacheEntry] = {}
+        # Every result of one extraction shares the time the run was collected
+        run_timestamp = datetime.now(UTC).isoformat(timespec="seconds")
+
+        # Walk Criterion's fixed layout once instead of descending into report/ and change/ trees
+        benchmark_names, estimates_files = [], []
+        for benchmark_name, estimates_file in _walk_criterion(self.results_dir):
+            benchmark_names.append(benchmark_name)
+            estimates_files.append(estimates_file)
+        max_workers = max(1, min(_MAX_ESTIMATES_WORKERS, os.cpu_count() or 1, len(estimates_files)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._read_estimates, path, cache.get(str(path)), run_timestamp) for path in estimates_files]
+
+            # Collect in discovery order so results and warnings are deterministic
+            for benchmark_name, estimates_file, future in zip(benchmark_names, estimates_files, futures, strict=True):
+                try:
+                    estimate, stat = future.result()
+                except (json.JSONDecodeError, KeyError, OSError) as e:
+                    print(f"Warning: Could not parse {estimates_file}: {e}")
+                    continue
 
-                if not isinstance(data, dict):
+                if estimate is None:
                     continue
 
-                data_dict = cast("dict[str, object]", data)
-
-                def _point_estimate(
-                    section_name: str,
-                    *,
-                    _data: dict[str, object] = data_dict,
-                ) -> float:
-                    section = _data.get(section_name)
-                    if not isinstance(section, dict):
-                        return 0.0
-
-                    section_dict = cast("dict[str, object]", section)
-                    point_estimate = section_dict.get("point_estimate")
-                    return float(point_estimate) if isinstance(point_estimate, (int, float)) else 0.0
-
-                # Build benchmark name from path structure
-                # e.g., action_calculations/calculate_action/50/base/estimates.json
-                # becomes "action_calculations/calculate_action/50"
-                path_parts = estimates_file.relative_to(self.results_dir).parts[:-2]  # Remove '<run_type>/estimates.json'
-                benchmark_name: str = "/".join(path_parts)
-
-                estimate: CriterionEstimate = {
-                    "mean_ns": _point_estimate("mean"),
-                    "std_dev_ns": _point_estimate("std_dev"),
-                    "median_ns": _point_estimate("median"),
-                    "mad_ns": _point_estimate("median_abs_dev"),
-                    "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+                updated_cache[str(estimates_file)] = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "result": {key: value for key, value in estimate.items() if key != "timestamp"},
                 }
-
-                # Add confidence intervals if available
-                self._extract_confidence_intervals(data_dict, estimate)
-
                 results[benchmark_name] = estimate
 
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"Warning: Could not parse {estimates_file}: {e}")
+        # Only persist entries for files that still exist so the cache cannot grow unbounded
+        if updated_cache != cache:
+            self._save_estimates_cache(updated_cache)
 
         return results
 
@@ -308,8 +643,9 @@ class PerformanceAnalyzer:
         filename = f"baseline_{tag}_{timestamp}.json" if tag else f"baseline_{timestamp}.json"
 
         baseline_file = self.baseline_dir / filename
-        with open(baseline_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2)
+        # Sorted keys keep baselines diff-friendly regardless of benchmark discovery order
+        _write_json(baseline_file, {"_schema": _BASELINE_SCHEMA_VERSION, "entries": results}, indent=True, sort_keys=True)
+        self._record_trend_means(baseline_file, results)
 
         # Update latest symlink (with Windows fallback)
         # On Windows, symlinks require elevated privileges, so we fall back to file copying
@@ -327,26 +663,46 @@ class PerformanceAnalyzer:
         print(f"✅ Saved baseline: {baseline_file}")
         return baseline_file
 
+    def _record_trend_means(self, baseline_file: Path, results: dict[str, CriterionEstimate]) -> None:
+        """Add a freshly written baseline to the trend cache so trend analysis never has to parse it."""
+        try:
+            stat = baseline_file.stat()
+        except OSError:
+            return
+
+        cache_path = self.baseline_dir / _TREND_CACHE_FILENAME
+        cache = _load_json_cache(cache_path)
+        cache[str(baseline_file)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "means": {benchmark: float(estimate["mean_ns"]) for benchmark, estimate in results.items()},
+        }
+        _save_json_cache(cache_path, cache, description="trend cache")
+
     def load_baseline(self, baseline_path: Path | None = None) -> dict[str, CriterionEstimate]:
         """Load baseline results."""
         if baseline_path is None:
             baseline_path = self.baseline_dir / "latest.json"
 
-        if not baseline_path.exists():
+        try:
+            stat = baseline_path.stat()
+        except FileNotFoundError:
             return {}
 
         try:
-            with open(baseline_path, encoding="utf-8") as f:
-                data: object = json.load(f)
+            # Repeated loads of an unchanged baseline (e.g. latest.json) reuse the decoded result
+            validated, error = _load_baseline_cached(str(baseline_path), stat.st_mtime_ns, stat.st_size)
         except (json.JSONDecodeError, FileNotFoundError) as e:
             print(f"Warning: Could not load baseline {baseline_path}: {e}")
             return {}
 
-        validated = _validated_baseline_data(data, baseline_path=baseline_path)
+        if error is not None:
+            print(error)
         if validated is None:
             return {}
 
-        return validated
+        # Copy each entry too, so callers that edit an estimate cannot change the cached result
+        return {benchmark: estimate.copy() for benchmark, estimate in validated.items()}
 
     def compare_results(
         self,
@@ -354,7 +710,7 @@ class PerformanceAnalyzer:
         baseline: dict[str, CriterionEstimate],
         threshold: float = 10.0,
     ) -> ComparisonResult:
-        """Compare current results with baseline and categorize changes."""
+        """Compare current results with baseline and categorize changes by median time."""
         comparison: ComparisonResult = {
             "regressions": [],
             "improvements": [],
@@ -363,124 +719,148 @@ class PerformanceAnalyzer:
             "summary": None,
         }
 
+        # Bind the hot lookups and appends once; this loop runs per benchmark.
+        baseline_get = baseline.get
+        add_new = comparison["new_benchmarks"].append
+        add_regression = comparison["regressions"].append
+        add_improvement = comparison["improvements"].append
+        add_stable = comparison["stable"].append
+        all_changes: list[float] = []
+        add_change = all_changes.append
+        change_sum = 0.0
+        max_regression = 0.0
+        max_improvement = 0.0
+        improvement_threshold = -threshold
+
         for benchmark, current_data in current.items():
-            if benchmark not in baseline:
-                comparison["new_benchmarks"].append({"benchmark": benchmark, "mean_ns": current_data["mean_ns"]})
+            baseline_entry = baseline_get(benchmark)
+            if baseline_entry is None:
+                add_new({"benchmark": benchmark, "mean_ns": current_data["mean_ns"]})
                 continue
 
-            current_mean = current_data["mean_ns"]
-            baseline_mean = baseline[benchmark]["mean_ns"]
-
-            if baseline_mean == 0:
+            # Compare medians: a single GC or scheduler outlier skews the mean and flags false regressions
+            baseline_median = baseline_entry["median_ns"]
+            if baseline_median == 0:
                 continue
 
-            change_percent = ((current_mean - baseline_mean) / baseline_mean) * 100
+            current_median = current_data["median_ns"]
+            change_percent = ((current_median - baseline_median) / baseline_median) * 100
 
             change_data: BenchmarkChange = {
                 "benchmark": benchmark,
                 "change_percent": change_percent,
-                "current_ns": current_mean,
-                "baseline_ns": baseline_mean,
+                "current_ns": current_median,
+                "baseline_ns": baseline_median,
                 "current_std": current_data["std_dev_ns"],
-                "baseline_std": baseline[benchmark]["std_dev_ns"],
+                "baseline_std": baseline_entry["std_dev_ns"],
             }
-
-            if change_percent > threshold:
-                comparison["regressions"].append(change_data)
-            elif change_percent < -threshold:
-                comparison["improvements"].append(change_data)
+            add_change(change_percent)
+            change_sum += change_percent
+
+            # Beyond the threshold, overlapping confidence intervals mean the change is within noise
+            if change_percent > threshold and not _confidence_intervals_overlap(current_data, baseline_entry):
+                add_regression(change_data)
+                max_regression = max(max_regression, change_percent)
+            elif change_percent < improvement_threshold and not _confidence_intervals_overlap(current_data, baseline_entry):
+                add_improvement(change_data)
+                max_improvement = max(max_improvement, -change_percent)
             else:
-                comparison["stable"].append(change_data)
+                add_stable(change_data)
 
         # Calculate summary statistics
-        all_changes = [item["change_percent"] for item in (comparison["regressions"] + comparison["improvements"] + comparison["stable"])]
-
         if all_changes:
+            # Mean and extremes from the running values; median from a single in-place sort
+            count = len(all_changes)
+            all_changes.sort()
+            mid = count // 2
+            median_change = all_changes[mid] if count % 2 else (all_changes[mid - 1] + all_changes[mid]) / 2
             comparison["summary"] = {
                 "total_benchmarks": len(current),
                 "regressions": len(comparison["regressions"]),
                 "improvements": len(comparison["improvements"]),
                 "stable": len(comparison["stable"]),
                 "new": len(comparison["new_benchmarks"]),
-                "avg_change": statistics.mean(all_changes),
-                "median_change": statistics.median(all_changes),
-                "max_regression": max([r["change_percent"] for r in comparison["regressions"]], default=0),
-                "max_improvement": max(
-                    (abs(i["change_percent"]) for i in comparison["improvements"]),
-                    default=0,
-                ),
+                "avg_change": change_sum / count,
+                "median_change": median_change,
+                "max_regression": max_regression,
+                "max_improvement": max_improvement,
             }
 
         return comparison
 
     def format_time_ns(self, nanoseconds: float) -> str:
         """Format nanoseconds into human-readable time units."""
-        if nanoseconds < 1000:
-            return f"{nanoseconds:.1f}ns"
-        if nanoseconds < 1_000_000:
-            return f"{nanoseconds / 1000:.1f}µs"
-        if nanoseconds < 1_000_000_000:
-            return f"{nanoseconds / 1_000_000:.1f}ms"
-        return f"{nanoseconds / 1_000_000_000:.2f}s"
-
-    def print_comparison_results(self, comparison: ComparisonResult) -> None:
-        """Print comparison results to console with colors."""
+        divisor, template = _TIME_UNITS[bisect_right(_TIME_UNIT_THRESHOLDS, nanoseconds)]
+        return template.format(nanoseconds / divisor)
+
+    def _change_lines(
+        self,
+        changes: list[BenchmarkChange],
+        top: int | None,
+        *,
+        largest_first: bool,
+        label: str,
+    ) -> Iterator[str]:
+        """Yield console lines for one category of changes, largest change first."""
+        format_time = self.format_time_ns
+        shown = _ordered_changes(changes, top, largest_first=largest_first)
+        for change in shown:
+            yield f"  {change['benchmark']}: +{abs(change['change_percent']):.1f}% {label}"
+            yield f"    Current: {format_time(change['current_ns'])}, Baseline: {format_time(change['baseline_ns'])}"
+        if len(shown) < len(changes):
+            yield f"  ... and {len(changes) - len(shown)} more"
+
+    def print_comparison_results(self, comparison: ComparisonResult, top: int | None = None) -> None:
+        """Print comparison results to console with colors.
+
+        With ``top``, only the ``top`` largest regressions and improvements are listed;
+        the summary still counts all of them.
+        """
         summary = comparison["summary"]
+        format_time = self.format_time_ns
+        # Buffer the output and write it once instead of one print per line
+        out: list[str] = []
+        emit = out.append
 
         if comparison["regressions"]:
-            print("🔴 PERFORMANCE REGRESSIONS DETECTED:")
-            for reg in sorted(
-                comparison["regressions"],
-                key=lambda x: x["change_percent"],
-                reverse=True,
-            ):
-                current_time = self.format_time_ns(reg["current_ns"])
-                baseline_time = self.format_time_ns(reg["baseline_ns"])
-                print(f"  {reg['benchmark']}: +{reg['change_percent']:.1f}% slower")
-                print(f"    Current: {current_time}, Baseline: {baseline_time}")
-            print()
+            emit("🔴 PERFORMANCE REGRESSIONS DETECTED:")
+            out.extend(self._change_lines(comparison["regressions"], top, largest_first=True, label="slower"))
+            emit("")
 
         if comparison["improvements"]:
-            print("🟢 PERFORMANCE IMPROVEMENTS:")
-            for imp in sorted(
-                comparison["improvements"],
-                key=lambda x: abs(x["change_percent"]),
-                reverse=True,
-            ):
-                current_time = self.format_time_ns(imp["current_ns"])
-                baseline_time = self.format_time_ns(imp["baseline_ns"])
-                improvement_pct = abs(imp["change_percent"])
-                print(f"  {imp['benchmark']}: +{improvement_pct:.1f}% faster")
-                print(f"    Current: {current_time}, Baseline: {baseline_time}")
-            print()
+            emit("🟢 PERFORMANCE IMPROVEMENTS:")
+            out.extend(self._change_lines(comparison["improvements"], top, largest_first=False, label="faster"))
+            emit("")
 
         if comparison["new_benchmarks"]:
-            print("🆕 NEW BENCHMARKS:")
+            emit("🆕 NEW BENCHMARKS:")
             for bench in comparison["new_benchmarks"]:
-                time_str = self.format_time_ns(bench["mean_ns"])
-                print(f"  {bench['benchmark']}: {time_str}")
-            print()
+                time_str = format_time(bench["mean_ns"])
+                emit(f"  {bench['benchmark']}: {time_str}")
+            emit("")
 
         if summary:
-            print("📈 SUMMARY:")
-            print(f"  Total benchmarks: {summary.get('total_benchmarks', 0)}")
-            print(f"  Regressions: {summary.get('regressions', 0)}")
-            print(f"  Improvements: {summary.get('improvements', 0)}")
-            print(f"  Stable: {summary.get('stable', 0)}")
-            print(f"  New: {summary.get('new', 0)}")
+            emit("📈 SUMMARY:")
+            emit(f"  Total benchmarks: {summary.get('total_benchmarks', 0)}")
+            emit(f"  Regressions: {summary.get('regressions', 0)}")
+            emit(f"  Improvements: {summary.get('improvements', 0)}")
+            emit(f"  Stable: {summary.get('stable', 0)}")
+            emit(f"  New: {summary.get('new', 0)}")
             avg_change = summary.get("avg_change")
             median_change = summary.get("median_change")
             if avg_change is not None and median_change is not None:
-                print(f"  Average change: {avg_change:.1f}%")
-                print(f"  Median change: {median_change:.1f}%")
+                emit(f"  Average change: {avg_change:.1f}%")
+                emit(f"  Median change: {median_change:.1f}%")
             if summary.get("max_regression"):
-                print(f"  Max regression: +{summary['max_regression']:.1f}%")
+                emit(f"  Max regression: +{summary['max_regression']:.1f}%")
             if summary.get("max_improvement"):
-                print(f"  Max improvement: +{summary['max_improvement']:.1f}%")
-            print()
+                emit(f"  Max improvement: +{summary['max_improvement']:.1f}%")
+            emit("")
 
         if not comparison["regressions"] and not comparison["improvements"] and not comparison["new_benchmarks"]:
-            print("✅ No significant performance changes detected")
+            emit("✅ No significant performance changes detected")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
     def generate_report(self, comparison: ComparisonResult, output_file: Path | None = None) -> str:
         """Generate a detailed performance report."""
@@ -491,6 +871,7 @@ class PerformanceAnalyzer:
             "",
         ]
 
+        format_time = self.format_time_ns
         summary = comparison["summary"]
         if summary:
             lines.extend(
@@ -516,17 +897,11 @@ class PerformanceAnalyzer:
                 ]
             )
 
-            for reg in sorted(
-                comparison["regressions"],
-                key=lambda x: x["change_percent"],
-                reverse=True,
-            ):
-                current_time = self.format_time_ns(reg["current_ns"])
-                baseline_time = self.format_time_ns(reg["baseline_ns"])
-                ratio = reg["current_ns"] / reg["baseline_ns"] if reg["baseline_ns"] != 0 else float("inf")
-                ratio_display = "∞" if math.isinf(ratio) else f"{ratio:.2f}"
-
-                lines.append(f"| {reg['benchmark']} | +{reg['change_percent']:.1f}% | {current_time} | {baseline_time} | {ratio_display}x |")
+            lines.extend(
+                f"| {reg['benchmark']} | +{reg['change_percent']:.1f}% | {format_time(reg['current_ns'])} | {format_time(reg['baseline_ns'])} | "
+                f"{_format_ratio(reg['current_ns'], reg['baseline_ns'])}x |"
+                for reg in _ordered_changes(comparison["regressions"], None, largest_first=True)
+            )
             lines.append("")
 
         if comparison["improvements"]:
@@ -538,25 +913,16 @@ class PerformanceAnalyzer:
                 ]
             )
 
-            for imp in sorted(
-                comparison["improvements"],
-                key=lambda x: abs(x["change_percent"]),
-                reverse=True,
-            ):
-                current_time = self.format_time_ns(imp["current_ns"])
-                baseline_time = self.format_time_ns(imp["baseline_ns"])
-                ratio = imp["baseline_ns"] / imp["current_ns"] if imp["current_ns"] != 0 else float("inf")
-                ratio_display = "∞" if math.isinf(ratio) else f"{ratio:.2f}"
-                improvement_pct = abs(imp["change_percent"])
-
-                lines.append(f"| {imp['benchmark']} | -{improvement_pct:.1f}% | {current_time} | {baseline_time} | {ratio_display}x |")
+            lines.extend(
+                f"| {imp['benchmark']} | -{abs(imp['change_percent']):.1f}% | {format_time(imp['current_ns'])} | {format_time(imp['baseline_ns'])} | "
+                f"{_format_ratio(imp['baseline_ns'], imp['current_ns'])}x |"
+                for imp in _ordered_changes(comparison["improvements"], None, largest_first=False)
+            )
             lines.append("")
 
         if comparison["new_benchmarks"]:
             lines.append("## 🆕 New Benchmarks")
-            for bench in comparison["new_benchmarks"]:
-                time_str = self.format_time_ns(bench["mean_ns"])
-                lines.append(f"- {bench['benchmark']}: {time_str}")
+            lines.extend(f"- {bench['benchmark']}: {format_time(bench['mean_ns'])}" for bench in comparison["new_benchmarks"])
             lines.append("")
 
         if comparison["stable"]:
@@ -571,71 +937,139 @@ class PerformanceAnalyzer:
         report_content = "\n".join(lines)
 
         if output_file:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(report_content)
+            output_file.write_text(report_content, encoding="utf-8")
             print(f"📄 Report saved to: {output_file}")
 
         return report_content
 
     @staticmethod
-    def _baseline_timestamp_from_filename(
-        baseline_file: Path,
-        timestamp_pattern: re.Pattern[str],
-    ) -> datetime | None:
-        match = timestamp_pattern.search(baseline_file.stem)
-        if not match:
+    @lru_cache(maxsize=1024)
+    def _baseline_timestamp_from_stem(stem: str) -> datetime | None:
+        # Only the trailing _YYYYMMDD_HHMMSS is the timestamp; tags may contain underscores.
+        # The shape is fixed, so slice it off rather than running a regex per file.
+        timestamp_str = stem[-_BASELINE_TIMESTAMP_LEN:]
+        digits = timestamp_str[:8] + timestamp_str[9:]
+        if (
+            stem[-_BASELINE_TIMESTAMP_LEN - 1 : -_BASELINE_TIMESTAMP_LEN] != "_"
+            or timestamp_str[8:9] != "_"
+            or not (digits.isascii() and digits.isdigit())
+        ):
             return None
 
-        timestamp_str = match.group(0)
         try:
-            # Baseline filenames do not encode a timezone; treat them as UTC.
-            return datetime.strptime(f"{timestamp_str}+0000", "%Y%m%d_%H%M%S%z")
+            # Baseline filenames do not encode a timezone; treat them as UTC. The fields are
+            # fixed-width digits, so build the datetime directly instead of going through strptime.
+            return datetime(
+                int(digits[0:4]),
+                int(digits[4:6]),
+                int(digits[6:8]),
+                int(digits[8:10]),
+                int(digits[10:12]),
+                int(digits[12:14]),
+                tzinfo=UTC,
+            )
         except ValueError:
             return None
 
     @staticmethod
     def _load_baseline_for_trend(baseline_file: Path) -> dict[str, CriterionEstimate] | None:
         try:
-            with baseline_file.open(encoding="utf-8") as f:
-                data: object = json.load(f)
+            data = _load_json(baseline_file)
         except json.JSONDecodeError:
             return None
 
         return _validated_baseline_data(data, baseline_path=baseline_file)
 
+    @staticmethod
+    def _cached_trend_means(cached: object, stat: os.stat_result) -> dict[str, float] | None:
+        """Return cached baseline means if the entry is still valid for a file with the given stat."""
+        if not _cache_entry_is_current(cached, stat):
+            return None
+
+        means = cast("dict[str, object]", cached).get("means")
+        if not isinstance(means, dict) or not all(isinstance(value, (int, float)) for value in means.values()):
+            return None
+
+        return cast("dict[str, float]", means)
+
+    @classmethod
+    def _load_baseline_means(cls, baseline_file: Path) -> dict[str, float] | None:
+        """Load a validated baseline and keep only each benchmark's mean_ns."""
+        data = cls._load_baseline_for_trend(baseline_file)
+        if data is None:
+            return None
+
+        return {benchmark: float(estimate["mean_ns"]) for benchmark, estimate in data.items()}
+
     def _load_trend_baselines(self, cutoff_date: datetime) -> list[LoadedBaseline]:
+        """Load baselines newer than ``cutoff_date``, oldest first.
+
+        The per-benchmark means of each baseline are cached in the baseline
+        directory, keyed by file path, modification time and size, so repeated
+        trend analyses do not re-parse unchanged baselines.
+        """
         baselines: list[LoadedBaseline] = []
-        timestamp_pattern = re.compile(r"\d{8}_\d{6}$")
+        cache_path = self.baseline_dir / _TREND_CACHE_FILENAME
+        cache = cast("dict[str, TrendCacheEntry]", _load_json_cache(cache_path))
+        updated_cache: dict[str, TrendCacheEntry] = {}
 
-        for baseline_file in self.baseline_dir.glob("baseline_*.json"):
-            timestamp = self._baseline_timestamp_from_filename(baseline_file, timestamp_pattern)
+        # scandir yields names and stat results directly; a Path is only built for baselines in the window
+        try:
+            with os.scandir(self.baseline_dir) as entries:
+                candidates = [entry for entry in entries if entry.name.startswith("baseline_") and entry.name.endswith(".json")]
+        except OSError:
+            candidates = []
+
+        for entry in candidates:
+            cache_key = entry.path
+            cached = cache.get(cache_key)
+
+            timestamp = self._baseline_timestamp_from_stem(entry.name.removesuffix(".json"))
             if timestamp is None or timestamp < cutoff_date:
+                # Keep entries for files that still exist; a wider window may need them
+                if cached is not None:
+                    updated_cache[cache_key] = cached
                 continue
 
-            data = self._load_baseline_for_trend(baseline_file)
-            if data is None:
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
                 continue
 
+            baseline_file = Path(entry.path)
+            means = self._cached_trend_means(cached, stat)
+            if means is None:
+                means = self._load_baseline_means(baseline_file)
+            if means is None:
+                continue
+
+            updated_cache[cache_key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "means": means}
             baselines.append(
                 {
                     "timestamp": timestamp,
                     "file": baseline_file,
-                    "data": data,
+                    "means": means,
                 }
             )
 
-        baselines.sort(key=lambda baseline: baseline["timestamp"])
+        if updated_cache != cache:
+            _save_json_cache(cache_path, updated_cache, description="trend cache")
+
+        baselines.sort(key=itemgetter("timestamp"))
         return baselines
 
     @staticmethod
     def _compute_trend_info(values: list[float]) -> TrendInfo:
         n = len(values)
 
-        # Calculate trend (simple linear regression slope over observation index)
-        sum_x = sum(range(n))
+        # Calculate trend (simple linear regression slope over observation index).
+        # x is 0..n-1, so its sums have closed forms and only y needs iterating.
+        sum_x = n * (n - 1) // 2
+        sum_xx = (n - 1) * n * (2 * n - 1) // 6
         sum_y = sum(values)
-        sum_xy = sum(i * v for i, v in enumerate(values))
-        sum_xx = sum(i * i for i in range(n))
+        sum_xy = sum(map(mul, range(n), values))
 
         denominator = n * sum_xx - sum_x * sum_x
         # All data points at same position - treat as stable
@@ -672,22 +1106,17 @@ class PerformanceAnalyzer:
             }
             return error_result
 
-        trends: dict[str, TrendInfo] = {}
-        benchmark_names: set[str] = set()
+        # Build every benchmark's time series in one chronological pass over the baselines
+        series: dict[str, list[float]] = {}
         for baseline in baselines:
-            benchmark_names.update(baseline["data"].keys())
-
-        for benchmark in benchmark_names:
-            values: list[float] = []
-            for baseline in baselines:
-                estimate = baseline["data"].get(benchmark)
-                if estimate is not None:
-                    values.append(float(estimate["mean_ns"]))
-
-            if len(values) < 2:
-                continue
+            for benchmark, mean_ns in baseline["means"].items():
+                values = series.get(benchmark)
+                if values is None:
+                    series[benchmark] = [mean_ns]
+                else:
+                    values.append(mean_ns)
 
-            trends[benchmark] = self._compute_trend_info(values)
+        trends: dict[str, TrendInfo] = {benchmark: self._compute_trend_info(values) for benchmark, values in series.items() if len(values) >= 2}
 
         success_result: TrendAnalysisSuccess = {
             "period_days": days,
@@ -697,6 +1126,19 @@ class PerformanceAnalyzer:
         return success_result
 
 
+def _non_negative_int(value: str) -> int:
+    """Parse a command-line count that must be zero or greater."""
+    try:
+        count = int(value)
+    except ValueError:
+        msg = f"invalid int value: {value!r}"
+        raise argparse.ArgumentTypeError(msg) from None
+    if count < 0:
+        msg = f"must be 0 or greater, got {count}"
+        raise argparse.ArgumentTypeError(msg)
+    return count
+
+
 def _build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="CDT Performance Analysis Tool",
@@ -739,6 +1181,13 @@ Examples:
         action="store_true",
         help="Skip running benchmarks, use existing results",
     )
+    parser.add_argument(
+        "--top",
+        type=_non_negative_int,
+        default=20,
+        metavar="N",
+        help="List at most N regressions and improvements in console output; 0 lists all (default: 20)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
     return parser
 
@@ -790,29 +1239,36 @@ def _handle_trends(analyzer: PerformanceAnalyzer, days: int) -> int:
         return 1
 
     success = cast("TrendAnalysisSuccess", trends)
+    out: list[str] = []
+    emit = out.append
 
-    print(f"Analyzed {success['baselines_analyzed']} baselines over {success['period_days']} days")
+    emit(f"Analyzed {success['baselines_analyzed']} baselines over {success['period_days']} days")
 
     degrading = [name for name, trend in success["trends"].items() if trend["trend"] == "degrading"]
     improving = [name for name, trend in success["trends"].items() if trend["trend"] == "improving"]
 
     if degrading:
-        print(f"\n🔴 Degrading trends ({len(degrading)} benchmarks):")
+        emit(f"\n🔴 Degrading trends ({len(degrading)} benchmarks):")
         for bench in degrading:
             change = success["trends"][bench]["change_percent"]
-            print(f"  {bench}: {change:+.1f}% over period")
+            emit(f"  {bench}: {change:+.1f}% over period")
 
     if improving:
-        print(f"\n🟢 Improving trends ({len(improving)} benchmarks):")
+        emit(f"\n🟢 Improving trends ({len(improving)} benchmarks):")
         for bench in improving:
             change = success["trends"][bench]["change_percent"]
-            print(f"  {bench}: {change:+.1f}% over period")
+            emit(f"  {bench}: {change:+.1f}% over period")
 
+    sys.stdout.write("\n".join(out) + "\n")
     return 0
 
 
-def _collect_current_results(analyzer: PerformanceAnalyzer, no_run: bool) -> dict[str, CriterionEstimate]:
-    if not no_run and not analyzer.run_benchmarks():
+def _collect_current_results(
+    analyzer: PerformanceAnalyzer,
+    no_run: bool,
+    verbose: bool = False,
+) -> dict[str, CriterionEstimate]:
+    if not no_run and not analyzer.run_benchmarks(verbose=verbose):
         return {}
 
     print("🔍 Extracting benchmark results...")
@@ -840,7 +1296,7 @@ def main(argv: list[str] | None = None) -> int:
     if args.trends is not None:
         return _handle_trends(analyzer, args.trends)
 
-    current_results = _collect_current_results(analyzer, args.no_run)
+    current_results = _collect_current_results(analyzer, args.no_run, args.verbose)
     if not current_results:
         return 1
 
@@ -858,7 +1314,7 @@ def main(argv: list[str] | None = None) -> int:
 
     print("📊 Comparing with baseline...")
     comparison = analyzer.compare_results(current_results, baseline, args.threshold)
-    analyzer.print_comparison_results(comparison)
+    analyzer.print_comparison_results(comparison, top=args.top)
 
     if args.report:
         analyzer.generate_report(comparison, Path(args.report))
@@ -74,3 +74,25 @@ def mock_git_command_result():
         return mock_result
 
     return _create_mock_result
+
+
+@pytest.fixture(params=[False, True], ids=["stdlib", "optional"])
+def json_backend(request, monkeypatch):
+    """
+    Pytest fixture running a test with an optional JSON dependency disabled and enabled.
+
+    The test module names the module and availability flag to toggle in a
+    ``JSON_BACKEND`` tuple. The enabled run is skipped when the dependency is
+    not installed.
+
+    Usage:
+        JSON_BACKEND = (performance_analysis, "_HAS_ORJSON")
+
+        @pytest.mark.usefixtures("json_backend")
+        def test_something():
+            ...
+    """
+    module, flag = request.module.JSON_BACKEND
+    if request.param and not getattr(module, flag):
+        pytest.skip(f"{flag.removeprefix('_HAS_').lower()} is not installed")
+    monkeypatch.setattr(module, flag, request.param)
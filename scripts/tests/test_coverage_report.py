@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test suite for coverage_report.py module.
+
+Tests Tarpaulin report decoding with both the streaming ijson reader and the
+standard library fallback, coverage entry extraction and prefix filtering.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import coverage_report
+from coverage_report import CoverageEntry, coverage_entries, filter_entries, iter_file_entries, parse_args
+
+# Module and availability flag toggled by the shared json_backend fixture
+JSON_BACKEND = (coverage_report, "_HAS_IJSON")
+
+
+def _write_report(tmp_path: Path, content: str) -> Path:
+    report = tmp_path / "tarpaulin-report.json"
+    report.write_text(content, encoding="utf-8")
+    return report
+
+
+@pytest.mark.usefixtures("json_backend")
+class TestIterFileEntries:
+    """Test cases for iter_file_entries on both decoding paths."""
+
+    def test_yields_file_entries(self, tmp_path):
+        """Test that every object in the files array is yielded."""
+        files = [
+            {"path": ["src", "lib.rs"], "coverable": 4, "covered": 3},
+            {"path": ["src", "main.rs"], "coverable": 2, "covered": 0},
+        ]
+        report = _write_report(tmp_path, json.dumps({"files": files}))
+
+        assert list(iter_file_entries(report)) == files
+
+    def test_skips_non_object_entries(self, tmp_path):
+        """Test that non-object items in the files array are ignored."""
+        report = _write_report(tmp_path, json.dumps({"files": [1, {"path": "a.rs"}, "x"]}))
+
+        assert list(iter_file_entries(report)) == [{"path": "a.rs"}]
+
+    def test_missing_files_key(self, tmp_path):
+        """Test that a report without a files array yields nothing."""
+        report = _write_report(tmp_path, json.dumps({"coverage": 0.0}))
+
+        assert list(iter_file_entries(report)) == []
+
+    @pytest.mark.parametrize("content", ["[1]", '"files"', "null"])
+    def test_rejects_non_object_root(self, tmp_path, content):
+        """Test that a report whose root is not a JSON object exits with a clear message."""
+        report = _write_report(tmp_path, content)
+
+        with pytest.raises(SystemExit, match="root must be a JSON object"):
+            list(iter_file_entries(report))
+
+    @pytest.mark.parametrize("content", ["", "{not json", '{"files": [{"path": "a.rs"}'])
+    def test_rejects_malformed_json(self, tmp_path, content):
+        """Test that malformed JSON exits with a parse error instead of a traceback."""
+        report = _write_report(tmp_path, content)
+
+        with pytest.raises(SystemExit, match="Could not parse coverage report"):
+            list(iter_file_entries(report))
+
+    def test_missing_report(self, tmp_path):
+        """Test that a missing report exits with a not-found message."""
+        with pytest.raises(SystemExit, match="Coverage report not found"):
+            list(iter_file_entries(tmp_path / "missing.json"))
+
+
+class TestCoverageEntries:
+    """Test cases for coverage entry extraction and filtering."""
+
+    def test_coverage_entries_skips_uncoverable_and_pathless(self):
+        """Test that entries without coverable lines or a path are dropped."""
+        files = [
+            {"path": ["src", "lib.rs"], "coverable": 4, "covered": 1},
+            {"path": ["src", "empty.rs"], "coverable": 0, "covered": 0},
+            {"coverable": 3, "covered": 3},
+            {"path": "src\\win.rs", "coverable": 2, "covered": 2},
+            {"path": ["src\\cdt", "a.rs"], "coverable": 1, "covered": 1},
+        ]
+
+        entries = list(coverage_entries(files))
+
+        assert entries == [
+            CoverageEntry(coverage=25.0, coverable=4, covered=1, path="src/lib.rs"),
+            CoverageEntry(coverage=100.0, coverable=2, covered=2, path="src/win.rs"),
+            CoverageEntry(coverage=100.0, coverable=1, covered=1, path="src/cdt/a.rs"),
+        ]
+
+    def test_filter_entries_matches_relative_prefix(self):
+        """Test that the prefix is matched against paths relative to the repo root."""
+        root = "/repo/"
+        entries = [
+            CoverageEntry(coverage=10.0, coverable=1, covered=0, path="/repo/src/cdt/a.rs"),
+            CoverageEntry(coverage=20.0, coverable=1, covered=0, path="/repo/src/cdtx/b.rs"),
+            CoverageEntry(coverage=30.0, coverable=1, covered=0, path="/repo/benches/c.rs"),
+        ]
+
+        filtered = list(filter_entries(entries, "src\\cdt", root))
+
+        assert [entry.relative_path(root) for entry in filtered] == ["src/cdt/a.rs"]
+
+
+class TestParseArgs:
+    """Test cases for command-line parsing."""
+
+    @pytest.mark.parametrize("value", ["-1", "two"])
+    def test_limit_rejects_invalid_counts(self, value, capsys):
+        """Test that --limit rejects negative and non-integer counts."""
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args(["--limit", value])
+
+        assert exc_info.value.code == 2
+        assert "--limit" in capsys.readouterr().err
+
+    def test_limit_accepts_zero(self):
+        """Test that --limit 0 is accepted."""
+        assert parse_args(["--limit", "0"]).limit == 0
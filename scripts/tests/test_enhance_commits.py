@@ -7,9 +7,7 @@ and Keep a Changelog format output functionality.
 """
 
 import io
-import tempfile
 from contextlib import redirect_stderr
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -625,14 +623,11 @@ class TestChangelogProcessing:
 class TestMainFunction:
     """Test cases for main function and CLI interface."""
 
-    def test_main_with_valid_files(self, temp_chdir):
+    def test_main_with_valid_files(self, temp_chdir, tmp_path):
         """Test main function with valid input and output files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test input file
-            input_file = temp_path / "input.md"
-            input_content = """# Changelog
+        # Create test input file
+        input_file = tmp_path / "input.md"
+        input_content = """# Changelog
 
 ## [1.0.0] - 2024-01-15
 
@@ -642,23 +637,23 @@ class TestMainFunction:
 - **Fix memory allocation bug** (#456)
 - **Update performance benchmarks** (#789)
 """
-            input_file.write_text(input_content, encoding="utf-8")
+        input_file.write_text(input_content, encoding="utf-8")
 
-            output_file = temp_path / "output.md"
+        output_file = tmp_path / "output.md"
 
-            with temp_chdir(temp_path):
-                # Mock sys.argv
-                with patch("sys.argv", ["enhance_commits.py", str(input_file), str(output_file)]):
-                    main()
+        with temp_chdir(tmp_path):
+            # Mock sys.argv
+            with patch("sys.argv", ["enhance_commits.py", str(input_file), str(output_file)]):
+                main()
 
-                # Verify output file was created
-                assert output_file.exists()
+            # Verify output file was created
+            assert output_file.exists()
 
-                output_content = output_file.read_text(encoding="utf-8")
-                assert "### Added" in output_content
-                assert "### Fixed" in output_content
-                assert "### Changed" in output_content
-                assert "triangulation algorithm" in output_content
+            output_content = output_file.read_text(encoding="utf-8")
+            assert "### Added" in output_content
+            assert "### Fixed" in output_content
+            assert "### Changed" in output_content
+            assert "triangulation algorithm" in output_content
 
     def test_main_with_invalid_args(self):
         """Test main function with invalid arguments."""
@@ -667,21 +662,18 @@ class TestMainFunction:
                 main()
             assert exc_info.value.code == 1
 
-    def test_main_with_nonexistent_input(self, temp_chdir):
+    def test_main_with_nonexistent_input(self, temp_chdir, tmp_path):
         """Test main function with nonexistent input file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            input_file = temp_path / "nonexistent.md"
-            output_file = temp_path / "output.md"
+        input_file = tmp_path / "nonexistent.md"
+        output_file = tmp_path / "output.md"
 
-            with (
-                temp_chdir(temp_path),
-                patch("sys.argv", ["enhance_commits.py", str(input_file), str(output_file)]),
-                pytest.raises(SystemExit) as exc_info,
-            ):
-                main()
-            assert exc_info.value.code == 1
+        with (
+            temp_chdir(tmp_path),
+            patch("sys.argv", ["enhance_commits.py", str(input_file), str(output_file)]),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+        assert exc_info.value.code == 1
 
 
 class TestEdgeCases:
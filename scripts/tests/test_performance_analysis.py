@@ -0,0 +1,767 @@
+#!/usr/bin/env python3
+"""
+Test suite for performance_analysis.py module.
+
+Tests Criterion result extraction, baseline handling, comparison and
+trend analysis using temporary project directories.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import performance_analysis
+from performance_analysis import CriterionEstimate, PerformanceAnalyzer
+
+BaselineFactory = Callable[[str, dict[str, float]], Path]
+
+
+# Module and availability flag toggled by the shared json_backend fixture
+JSON_BACKEND = (performance_analysis, "_HAS_ORJSON")
+
+
+def _estimate(mean_ns: float, std_dev_ns: float = 0.0) -> CriterionEstimate:
+    return {
+        "mean_ns": mean_ns,
+        "std_dev_ns": std_dev_ns,
+        "median_ns": mean_ns,
+        "mad_ns": 0.0,
+        "timestamp": "2025-01-01T00:00:00+00:00",
+    }
+
+
+def _write_estimates(
+    tmp_path: Path,
+    benchmark: str,
+    mean_ns: float,
+    *,
+    run_type: str = "new",
+) -> Path:
+    """Write a minimal Criterion estimates.json for ``benchmark`` under tmp_path."""
+    estimates_dir = tmp_path / "target" / "criterion" / benchmark / run_type
+    estimates_dir.mkdir(parents=True, exist_ok=True)
+
+    payload = {
+        "mean": {
+            "point_estimate": mean_ns,
+            "confidence_interval": {"lower_bound": mean_ns * 0.5, "upper_bound": mean_ns * 2},
+        },
+        "std_dev": {"point_estimate": mean_ns * 0.25},
+        "median": {
+            "point_estimate": mean_ns,
+            "confidence_interval": {"lower_bound": mean_ns * 0.75, "upper_bound": mean_ns * 1.5},
+        },
+        "median_abs_dev": {"point_estimate": mean_ns * 0.125},
+        "slope": None,
+    }
+    estimates_file = estimates_dir / "estimates.json"
+    estimates_file.write_text(json.dumps(payload), encoding="utf-8")
+    return estimates_file
+
+
+# Distinct, ordered baseline timestamps on the current date: trend analysis only
+# needs their order, and they fall inside any analysis window.
+_TODAY = datetime.now(UTC).strftime("%Y%m%d")
+_FIXED_TIMESTAMPS = (f"{_TODAY}_000001", f"{_TODAY}_000002", f"{_TODAY}_000003")
+
+
+def _baseline_name(index: int, tag: str | None = None) -> str:
+    timestamp = _FIXED_TIMESTAMPS[index]
+    return f"baseline_{tag}_{timestamp}.json" if tag else f"baseline_{timestamp}.json"
+
+
+# One baseline entry in the legacy (unmarked) flat format that predates the schema envelope.
+_BASELINE_ROW_TMPL = '{name}:{{"mean_ns":{m},"std_dev_ns":0.0,"median_ns":{m},"mad_ns":0.0,"timestamp":"{ts}"}}'
+
+
+@pytest.fixture
+def baseline_factory(tmp_path: Path) -> BaselineFactory:
+    """Return a writer for baseline files in the legacy (unmarked) baseline format.
+
+    PerformanceAnalyzer.save_baseline now writes a schema-marked envelope; these
+    files exercise the per-entry validation that older baselines still go through.
+
+    The baseline directory and timestamp are set up once per test rather than
+    on every write, and rows are rendered from a fixed template instead of
+    going through the generic JSON encoder.
+    """
+    baseline_dir = tmp_path / "performance_baselines"
+    baseline_dir.mkdir()
+    quote = json.JSONEncoder().encode
+    timestamp = datetime.now(UTC).isoformat(timespec="seconds")
+
+    def write(filename: str, means_by_benchmark: dict[str, float]) -> Path:
+        rows = ",".join(_BASELINE_ROW_TMPL.format(name=quote(name), m=mean_ns, ts=timestamp) for name, mean_ns in means_by_benchmark.items())
+        baseline_file = baseline_dir / filename
+        baseline_file.write_bytes(f"{{{rows}}}".encode("ascii"))
+        return baseline_file
+
+    return write
+
+
+def _bump_mtime(path: Path) -> None:
+    """Move ``path``'s mtime one second forward so mtime-keyed caches see a rewrite even on coarse clocks."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _with_ci(estimate: CriterionEstimate, lower: float, upper: float) -> CriterionEstimate:
+    return {**estimate, "median_ci_lower": lower, "median_ci_upper": upper}
+
+
+class TestExtractCriterionResults:
+    """Test cases for reading Criterion estimates.json results."""
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_reads_estimates(self, tmp_path: Path) -> None:
+        """Test that point estimates and confidence bounds are read from estimates.json."""
+        _write_estimates(tmp_path, "group/bench/10", 1500.0)
+        _write_estimates(tmp_path, "group/other", 250.0, run_type="base")
+
+        results = PerformanceAnalyzer(tmp_path).extract_criterion_results()
+
+        assert set(results) == {"group/bench/10", "group/other"}
+        bench = results["group/bench/10"]
+        assert bench["mean_ns"] == 1500.0
+        assert bench["median_ns"] == 1500.0
+        assert bench["std_dev_ns"] == 375.0
+        assert bench["mad_ns"] == 187.5
+        assert bench["mean_ci_lower"] == 750.0
+        assert bench["mean_ci_upper"] == 3000.0
+        assert bench["median_ci_lower"] == 1125.0
+        assert bench["median_ci_upper"] == 2250.0
+        assert isinstance(bench["timestamp"], str)
+
+    def test_share_one_run_timestamp(self, tmp_path: Path) -> None:
+        """Test that every estimate in a run carries the same timestamp."""
+        _write_estimates(tmp_path, "group/a", 100.0)
+        _write_estimates(tmp_path, "group/b", 200.0)
+        analyzer = PerformanceAnalyzer(tmp_path)
+        analyzer.extract_criterion_results()
+        _write_estimates(tmp_path, "group/c", 300.0)
+
+        results = analyzer.extract_criterion_results()
+
+        assert len({estimate["timestamp"] for estimate in results.values()}) == 1
+
+    def test_prefers_new_over_base(self, tmp_path: Path) -> None:
+        """Test that the new/ run wins over base/ for the same benchmark."""
+        _write_estimates(tmp_path, "group/bench", 100.0)
+        _write_estimates(tmp_path, "group/bench", 900.0, run_type="base")
+
+        results = PerformanceAnalyzer(tmp_path).extract_criterion_results()
+
+        assert results["group/bench"]["mean_ns"] == 100.0
+
+    def test_reads_ungrouped_benchmarks(self, tmp_path: Path) -> None:
+        """Test that benchmarks outside a Criterion group are found."""
+        _write_estimates(tmp_path, "standalone", 100.0)
+
+        results = PerformanceAnalyzer(tmp_path).extract_criterion_results()
+
+        assert set(results) == {"standalone"}
+
+    def test_ignores_non_run_directories(self, tmp_path: Path) -> None:
+        """Test that change/ and report/ directories are not read as runs."""
+        _write_estimates(tmp_path, "group/bench", 100.0, run_type="change")
+        _write_estimates(tmp_path, "group/bench/report", 100.0)
+
+        assert PerformanceAnalyzer(tmp_path).extract_criterion_results() == {}
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_reads_memory_mapped_estimates(self, tmp_path: Path, monkeypatch) -> None:
+        """Test decoding estimates through the memory-mapped path."""
+        monkeypatch.setattr(performance_analysis, "_MMAP_JSON_MIN_BYTES", 0)
+        _write_estimates(tmp_path, "group/bench", 1500.0)
+
+        results = PerformanceAnalyzer(tmp_path).extract_criterion_results()
+
+        assert results["group/bench"]["mean_ns"] == 1500.0
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_reuses_cache_for_unchanged_files(self, tmp_path: Path) -> None:
+        """Test that unchanged estimates files are served from the parse cache."""
+        _write_estimates(tmp_path, "group/bench", 100.0)
+        analyzer = PerformanceAnalyzer(tmp_path)
+
+        first = analyzer.extract_criterion_results()
+        assert (analyzer.reports_dir / ".estimates_cache.json").is_file()
+
+        with (
+            patch.object(PerformanceAnalyzer, "_parse_estimates_file") as mock_parse,
+            patch("performance_analysis._baseline_entry_validation_error") as mock_describe,
+        ):
+            second = analyzer.extract_criterion_results()
+
+        mock_parse.assert_not_called()
+        mock_describe.assert_not_called()
+        assert second["group/bench"]["mean_ns"] == first["group/bench"]["mean_ns"]
+        assert second["group/bench"]["mean_ci_upper"] == first["group/bench"]["mean_ci_upper"]
+
+    def test_reparses_cache_entries_without_median_intervals(self, tmp_path: Path) -> None:
+        """Test that cache entries recorded before median intervals were extracted are parsed again."""
+        _write_estimates(tmp_path, "group/bench", 100.0)
+        analyzer = PerformanceAnalyzer(tmp_path)
+        analyzer.extract_criterion_results()
+        cache_path = analyzer.reports_dir / performance_analysis._ESTIMATES_CACHE_FILENAME
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        for entry in cache.values():
+            del entry["result"]["median_ci_lower"], entry["result"]["median_ci_upper"]
+        cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+        results = analyzer.extract_criterion_results()
+
+        assert results["group/bench"]["median_ci_lower"] == 75.0
+
+    def test_reparses_invalid_cache_entries(self, tmp_path: Path) -> None:
+        """Test that cache entries with non-numeric fields are parsed again."""
+        _write_estimates(tmp_path, "group/bench", 100.0)
+        analyzer = PerformanceAnalyzer(tmp_path)
+        analyzer.extract_criterion_results()
+        cache_path = analyzer.reports_dir / performance_analysis._ESTIMATES_CACHE_FILENAME
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        for entry in cache.values():
+            entry["result"]["mean_ns"] = "fast"
+        cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+        results = analyzer.extract_criterion_results()
+
+        assert results["group/bench"]["mean_ns"] == 100.0
+
+    def test_reparses_modified_files(self, tmp_path: Path) -> None:
+        """Test that a modified estimates file is parsed again."""
+        estimates_file = _write_estimates(tmp_path, "group/bench", 100.0)
+        analyzer = PerformanceAnalyzer(tmp_path)
+        analyzer.extract_criterion_results()
+
+        _write_estimates(tmp_path, "group/bench", 200.0)
+        _bump_mtime(estimates_file)
+
+        results = analyzer.extract_criterion_results()
+
+        assert results["group/bench"]["mean_ns"] == 200.0
+
+    def test_ignores_corrupt_cache(self, tmp_path: Path) -> None:
+        """Test that a corrupt parse cache is treated as empty."""
+        _write_estimates(tmp_path, "group/bench", 100.0)
+        analyzer = PerformanceAnalyzer(tmp_path)
+        (analyzer.reports_dir / ".estimates_cache.json").write_text("{not json", encoding="utf-8")
+
+        results = analyzer.extract_criterion_results()
+
+        assert results["group/bench"]["mean_ns"] == 100.0
+
+    def test_skips_malformed_files(self, tmp_path: Path, capsys) -> None:
+        """Test that malformed estimates files are skipped with a warning."""
+        _write_estimates(tmp_path, "group/good", 100.0)
+        bad_file = _write_estimates(tmp_path, "group/bad", 100.0)
+        bad_file.write_text("{not json", encoding="utf-8")
+
+        results = PerformanceAnalyzer(tmp_path).extract_criterion_results()
+
+        assert set(results) == {"group/good"}
+        assert f"Warning: Could not parse {bad_file}" in capsys.readouterr().out
+
+
+class TestCompareResults:
+    """Test cases for baseline comparison and console output."""
+
+    def test_compare_results_categorizes_changes(self, tmp_path: Path) -> None:
+        """Test regression, improvement, stable and new categorization with summary statistics."""
+        analyzer = PerformanceAnalyzer(tmp_path)
+        baseline = {
+            "slower": _estimate(100.0, 1.0),
+            "faster": _estimate(100.0, 2.0),
+            "same": _estimate(100.0),
+            "zero": _estimate(0.0),
+        }
+        current = {
+            "slower": _estimate(150.0, 3.0),
+            "faster": _estimate(50.0),
+            "same": _estimate(105.0),
+            "zero": _estimate(10.0),
+            "brand_new": _estimate(42.0),
+        }
+
+        comparison = analyzer.compare_results(current, baseline, threshold=10.0)
+
+        assert [r["benchmark"] for r in comparison["regressions"]] == ["slower"]
+        assert comparison["regressions"][0]["change_percent"] == pytest.approx(50.0)
+        assert comparison["regressions"][0]["current_std"] == 3.0
+        assert comparison["regressions"][0]["baseline_std"] == 1.0
+        assert [i["benchmark"] for i in comparison["improvements"]] == ["faster"]
+        assert [s["benchmark"] for s in comparison["stable"]] == ["same"]
+        assert comparison["new_benchmarks"] == [{"benchmark": "brand_new", "mean_ns": 42.0}]
+
+        summary = comparison["summary"]
+        assert summary is not None
+        assert summary["total_benchmarks"] == 5
+        assert (summary["regressions"], summary["improvements"], summary["stable"], summary["new"]) == (1, 1, 1, 1)
+        assert summary["avg_change"] == pytest.approx(5.0 / 3.0)
+        assert summary["median_change"] == pytest.approx(5.0)
+        assert summary["max_regression"] == pytest.approx(50.0)
+        assert summary["max_improvement"] == pytest.approx(50.0)
+
+    def test_compare_results_uses_medians(self, tmp_path: Path) -> None:
+        """Test that comparisons use medians so skewed means do not flag regressions."""
+        baseline = {"outlier": _estimate(100.0), "slower": _estimate(100.0)}
+        current = {"outlier": {**_estimate(100.0), "mean_ns": 300.0}, "slower": {**_estimate(100.0), "median_ns": 150.0}}
+
+        comparison = PerformanceAnalyzer(tmp_path).compare_results(current, baseline, threshold=10.0)
+
+        assert [s["benchmark"] for s in comparison["stable"]] == ["outlier"]
+        assert [r["benchmark"] for r in comparison["regressions"]] == ["slower"]
+        assert comparison["regressions"][0]["current_ns"] == 150.0
+
+    def test_compare_results_treats_overlapping_confidence_intervals_as_stable(self, tmp_path: Path) -> None:
+        """Test that overlapping confidence intervals keep a change stable."""
+        baseline = {
+            "noisy": _with_ci(_estimate(100.0), 80.0, 130.0),
+            "slower": _with_ci(_estimate(100.0), 95.0, 105.0),
+            "faster": _with_ci(_estimate(100.0), 80.0, 130.0),
+        }
+        current = {
+            "noisy": _with_ci(_estimate(120.0), 100.0, 150.0),
+            "slower": _with_ci(_estimate(120.0), 115.0, 125.0),
+            "faster": _with_ci(_estimate(60.0), 50.0, 85.0),
+        }
+
+        comparison = PerformanceAnalyzer(tmp_path).compare_results(current, baseline, threshold=10.0)
+
+        assert [r["benchmark"] for r in comparison["regressions"]] == ["slower"]
+        assert comparison["improvements"] == []
+        assert [s["benchmark"] for s in comparison["stable"]] == ["noisy", "faster"]
+        assert comparison["summary"] is not None
+        assert comparison["summary"]["max_regression"] == pytest.approx(20.0)
+        assert comparison["summary"]["max_improvement"] == 0.0
+
+    def test_compare_results_gates_on_median_confidence_intervals(self, tmp_path: Path) -> None:
+        """Test that a wide mean interval does not hide a median regression with separated median intervals."""
+        baseline = {"bench": {**_with_ci(_estimate(100.0), 95.0, 105.0), "mean_ci_lower": 50.0, "mean_ci_upper": 400.0}}
+        current = {"bench": {**_with_ci(_estimate(150.0), 140.0, 160.0), "mean_ci_lower": 60.0, "mean_ci_upper": 500.0}}
+
+        comparison = PerformanceAnalyzer(tmp_path).compare_results(current, baseline, threshold=10.0)
+
+        assert [r["benchmark"] for r in comparison["regressions"]] == ["bench"]
+
+    def test_print_comparison_results_limits_listed_changes(self, tmp_path: Path, capsys) -> None:
+        """Test that --top caps the listed changes and reports the remainder."""
+        analyzer = PerformanceAnalyzer(tmp_path)
+        baseline = {f"bench_{i}": _estimate(100.0) for i in range(5)}
+        current = {f"bench_{i}": _estimate(100.0 + 20.0 * (i + 1)) for i in range(5)}
+        comparison = analyzer.compare_results(current, baseline)
+
+        analyzer.print_comparison_results(comparison, top=2)
+
+        out = capsys.readouterr().out
+        assert "bench_4: +100.0% slower" in out
+        assert "bench_3: +80.0% slower" in out
+        assert "bench_2" not in out
+        assert "... and 3 more" in out
+        assert "Regressions: 5" in out
+
+    @pytest.mark.parametrize("value", ["-1", "two"])
+    def test_top_rejects_invalid_counts(self, value: str, capsys) -> None:
+        """Test that --top rejects negative and non-integer counts."""
+        with pytest.raises(SystemExit) as exc_info:
+            performance_analysis._build_arg_parser().parse_args(["--top", value])
+
+        assert exc_info.value.code == 2
+        assert "--top" in capsys.readouterr().err
+
+    def test_top_accepts_zero(self) -> None:
+        """Test that --top 0 is accepted to list every change."""
+        assert performance_analysis._build_arg_parser().parse_args(["--top", "0"]).top == 0
+
+    def test_compare_results_without_shared_benchmarks_has_no_summary(self, tmp_path: Path) -> None:
+        """Test that no summary is produced when no benchmark is shared."""
+        comparison = PerformanceAnalyzer(tmp_path).compare_results({"a": _estimate(1.0)}, {})
+
+        assert comparison["summary"] is None
+        assert comparison["new_benchmarks"] == [{"benchmark": "a", "mean_ns": 1.0}]
+
+    def test_compare_results_median_of_even_number_of_changes(self, tmp_path: Path) -> None:
+        """Test the median change of an even number of benchmarks."""
+        baseline = {name: _estimate(100.0) for name in ("a", "b", "c", "d")}
+        current = {"a": _estimate(90.0), "b": _estimate(100.0), "c": _estimate(104.0), "d": _estimate(130.0)}
+
+        summary = PerformanceAnalyzer(tmp_path).compare_results(current, baseline)["summary"]
+
+        assert summary is not None
+        assert summary["median_change"] == pytest.approx(2.0)
+        assert summary["avg_change"] == pytest.approx(6.0)
+
+
+class TestAnalyzerSetup:
+    """Test cases for PerformanceAnalyzer construction."""
+
+    def test_recreates_deleted_output_directories(self, tmp_path: Path) -> None:
+        """Test that a new analyzer recreates output directories removed since an earlier one."""
+        PerformanceAnalyzer(tmp_path)
+        shutil.rmtree(tmp_path / "performance_baselines")
+        shutil.rmtree(tmp_path / "performance_reports")
+
+        analyzer = PerformanceAnalyzer(tmp_path)
+
+        assert analyzer.baseline_dir.is_dir()
+        assert analyzer.reports_dir.is_dir()
+        assert analyzer.save_baseline({"bench": _estimate(1.0)}).is_file()
+
+
+class TestReportGeneration:
+    """Test cases for time formatting and markdown report generation."""
+
+    @pytest.mark.parametrize(
+        ("nanoseconds", "expected"),
+        [
+            (0.0, "0.0ns"),
+            (999.9, "999.9ns"),
+            (1_000.0, "1.0µs"),
+            (999_999.0, "1000.0µs"),
+            (1_000_000.0, "1.0ms"),
+            (250_000_000.0, "250.0ms"),
+            (1_000_000_000.0, "1.00s"),
+            (3_456_000_000.0, "3.46s"),
+        ],
+    )
+    def test_format_time_ns(self, tmp_path: Path, nanoseconds: float, expected: str) -> None:
+        """Test time formatting across unit boundaries."""
+        assert PerformanceAnalyzer(tmp_path).format_time_ns(nanoseconds) == expected
+
+    def test_generate_report_writes_markdown_tables(self, tmp_path: Path) -> None:
+        """Test that the report tables are rendered and written to the output file."""
+        analyzer = PerformanceAnalyzer(tmp_path)
+        baseline = {"slow": _estimate(1_000.0), "fast": _estimate(2_000_000.0), "same": _estimate(50.0)}
+        current = {"slow": _estimate(1_500.0), "fast": _estimate(1_000_000.0), "same": _estimate(50.0), "new": _estimate(75.0)}
+        comparison = analyzer.compare_results(current, baseline)
+        output_file = tmp_path / "report.md"
+
+        report = analyzer.generate_report(comparison, output_file)
+
+        assert output_file.read_text(encoding="utf-8") == report
+        assert "| slow | +50.0% | 1.5µs | 1.0µs | 1.50x |" in report
+        assert "| fast | -50.0% | 1.0ms | 2.0ms | 2.00x |" in report
+        assert "- new: 75.0ns" in report
+        assert "No significant changes detected in 1 benchmarks." in report
+
+    def test_generate_report_shows_infinite_ratio(self, tmp_path: Path) -> None:
+        """Test that a zero current time renders an infinite ratio."""
+        comparison = {
+            "regressions": [],
+            "improvements": [
+                {
+                    "benchmark": "instant",
+                    "change_percent": -100.0,
+                    "current_ns": 0.0,
+                    "baseline_ns": 10.0,
+                    "current_std": 0.0,
+                    "baseline_std": 0.0,
+                }
+            ],
+            "new_benchmarks": [],
+            "stable": [],
+            "summary": None,
+        }
+
+        report = PerformanceAnalyzer(tmp_path).generate_report(comparison)
+
+        assert "| instant | -100.0% | 0.0ns | 10.0ns | ∞x |" in report
+
+    def test_generate_report_orders_largest_changes_first(self, tmp_path: Path) -> None:
+        """Test that report tables list the largest changes first."""
+        analyzer = PerformanceAnalyzer(tmp_path)
+        baseline = {name: _estimate(100.0) for name in ("reg_small", "reg_large", "imp_small", "imp_large")}
+        current = {
+            "reg_small": _estimate(120.0),
+            "reg_large": _estimate(200.0),
+            "imp_small": _estimate(80.0),
+            "imp_large": _estimate(25.0),
+        }
+
+        report = analyzer.generate_report(analyzer.compare_results(current, baseline))
+
+        assert report.index("| reg_large |") < report.index("| reg_small |")
+        assert report.index("| imp_large |") < report.index("| imp_small |")
+
+
+class TestAnalyzeTrends:
+    """Test cases for trend analysis over historical baselines."""
+
+    def test_requires_two_baselines(self, tmp_path: Path, baseline_factory: BaselineFactory) -> None:
+        """Test that a single baseline is not enough for trend analysis."""
+        baseline_factory(_baseline_name(0), {"bench": 100.0})
+
+        result = PerformanceAnalyzer(tmp_path).analyze_trends(days=30)
+
+        assert result == {"error": "Not enough historical data for trend analysis"}
+
+    def test_classifies_improving_stable_degrading(self, tmp_path: Path, baseline_factory: BaselineFactory) -> None:
+        """Test trend classification and regression slope per benchmark."""
+        series = {
+            "improving": [300.0, 200.0, 100.0],
+            "stable": [100.0, 100.0, 100.0],
+            "degrading": [100.0, 150.0, 200.0],
+        }
+        for index in range(3):
+            means = {name: values[index] for name, values in series.items()}
+            baseline_factory(_baseline_name(index), means)
+
+        result = PerformanceAnalyzer(tmp_path).analyze_trends(days=30)
+
+        assert "error" not in result
+        assert result["baselines_analyzed"] == 3
+        trends = result["trends"]
+        assert trends["improving"]["trend"] == "improving"
+        assert trends["improving"]["slope"] == pytest.approx(-100.0)
+        assert trends["improving"]["change_percent"] == pytest.approx(-100.0 * 2 / 3)
+        assert trends["stable"]["trend"] == "stable"
+        assert trends["stable"]["slope"] == pytest.approx(0.0)
+        assert trends["degrading"]["trend"] == "degrading"
+        assert trends["degrading"]["slope"] == pytest.approx(50.0)
+        assert trends["degrading"]["first_value"] == 100.0
+        assert trends["degrading"]["last_value"] == 200.0
+        assert trends["degrading"]["data_points"] == 3
+
+    def test_ignores_baselines_outside_window(self, tmp_path: Path, baseline_factory: BaselineFactory) -> None:
+        """Test that baselines older than the window are ignored."""
+        baseline_factory("baseline_20000101_000000.json", {"bench": 1_000.0})
+        baseline_factory(_baseline_name(0), {"bench": 100.0})
+        baseline_factory(_baseline_name(1), {"bench": 110.0})
+
+        result = PerformanceAnalyzer(tmp_path).analyze_trends(days=7)
+
+        assert "error" not in result
+        assert result["baselines_analyzed"] == 2
+        assert result["trends"]["bench"]["first_value"] == 100.0
+
+    def test_parses_tagged_baseline_filenames(self, tmp_path: Path, baseline_factory: BaselineFactory) -> None:
+        """Test that tagged filenames are dated and untimed ones are skipped."""
+        baseline_factory(_baseline_name(0, tag="v1.0.0_rc_1"), {"bench": 100.0})
+        baseline_factory(_baseline_name(1, tag="v1.0.0"), {"bench": 120.0})
+        baseline_factory("baseline_untimed.json", {"bench": 5.0})
+
+        result = PerformanceAnalyzer(tmp_path).analyze_trends(days=7)
+
+        assert "error" not in result
+        assert result["baselines_analyzed"] == 2
+        assert result["trends"]["bench"]["trend"] == "degrading"
+
+    def test_skips_invalid_baselines(self, tmp_path: Path, baseline_factory: BaselineFactory) -> None:
+        """Test that unreadable baselines are skipped."""
+        baseline_factory(_baseline_name(0), {"bench": 100.0})
+        baseline_factory(_baseline_name(1), {"bench": 90.0})
+        corrupt = tmp_path / "performance_baselines" / _baseline_name(2)
+        corrupt.write_text("{not json", encoding="utf-8")
+
+        result = PerformanceAnalyzer(tmp_path).analyze_trends(days=7)
+
+        assert "error" not in result
+        assert result["baselines_analyzed"] == 2
+        assert result["trends"]["bench"]["trend"] == "improving"
+
+    def test_reads_schema_marked_baselines(self, tmp_path: Path) -> None:
+        """Test trend analysis over envelope-format baselines written by save_baseline."""
+        writer = PerformanceAnalyzer(tmp_path)
+        for index, mean_ns in enumerate((100.0, 150.0, 200.0)):
+            saved = writer.save_baseline({"bench": _estimate(mean_ns)})
+            saved.rename(saved.with_name(_baseline_name(index)))
+        # Drop the means save_baseline recorded so the renamed files are decoded
+        (writer.baseline_dir / performance_analysis._TREND_CACHE_FILENAME).unlink()
+
+        with patch("performance_analysis._is_valid_baseline_entry") as mock_check:
+            result = PerformanceAnalyzer(tmp_path).analyze_trends(days=7)
+
+        mock_check.assert_not_called()
+        assert "error" not in result
+        assert result["baselines_analyzed"] == 3
+        assert result["trends"]["bench"]["trend"] == "degrading"
+        assert result["trends"]["bench"]["slope"] == pytest.approx(50.0)
+
+    def test_reuses_cached_baselines(self, tmp_path: Path, baseline_factory: BaselineFactory) -> None:
+        """Test that unchanged baselines are served from the trend cache."""
+        baseline_factory(_baseline_name(0), {"bench": 100.0})
+        baseline_factory(_baseline_name(1), {"bench": 50.0})
+        analyzer = PerformanceAnalyzer(tmp_path)
+
+        first = analyzer.analyze_trends(days=7)
+        assert (analyzer.baseline_dir / ".trend_cache.json").exists()
+
+        with patch.object(PerformanceAnalyzer, "_load_baseline_means") as mock_load:
+            second = analyzer.analyze_trends(days=7)
+
+        mock_load.assert_not_called()
+        assert second == first
+
+    def test_uses_means_recorded_by_save_baseline(self, tmp_path: Path, baseline_factory: BaselineFactory) -> None:
+        """Test that save_baseline records its means in the trend cache."""
+        analyzer = PerformanceAnalyzer(tmp_path)
+        baseline_factory(_baseline_name(0), {"bench": 100.0})
+        analyzer.save_baseline({"bench": _estimate(50.0)})
+
+        with patch.object(PerformanceAnalyzer, "_load_baseline_means", return_value={"bench": 100.0}) as mock_load:
+            result = analyzer.analyze_trends(days=7)
+
+        assert mock_load.call_count == 1
+        assert result["trends"]["bench"]["trend"] == "improving"
+
+    def test_reloads_modified_baselines(self, tmp_path: Path, baseline_factory: BaselineFactory) -> None:
+        """Test that a modified baseline is loaded again."""
+        baseline_factory(_baseline_name(0), {"bench": 100.0})
+        latest = baseline_factory(_baseline_name(1), {"bench": 50.0})
+        analyzer = PerformanceAnalyzer(tmp_path)
+        assert analyzer.analyze_trends(days=7)["trends"]["bench"]["trend"] == "improving"
+
+        baseline_factory(latest.name, {"bench": 200.0})
+        _bump_mtime(latest)
+
+        assert analyzer.analyze_trends(days=7)["trends"]["bench"]["trend"] == "degrading"
+
+
+class TestRunBenchmarks:
+    """Test cases for running cargo bench."""
+
+    @pytest.mark.parametrize(
+        ("verbose", "expected_stdout", "expected_stderr"),
+        [
+            (False, subprocess.DEVNULL, subprocess.PIPE),
+            (True, None, None),
+        ],
+    )
+    def test_does_not_buffer_stdout(self, tmp_path: Path, verbose: bool, expected_stdout, expected_stderr) -> None:
+        """Test that benchmark output is streamed or discarded, never buffered."""
+        completed = subprocess.CompletedProcess(args=["cargo"], returncode=0, stdout=None, stderr="")
+
+        with patch("performance_analysis.run_cargo_command", return_value=completed) as mock_run:
+            assert PerformanceAnalyzer(tmp_path).run_benchmarks(verbose=verbose)
+
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["capture_output"] is False
+        assert kwargs["stdout"] is expected_stdout
+        assert kwargs["stderr"] is expected_stderr
+
+    def test_reports_captured_stderr_on_failure(self, tmp_path: Path, capsys) -> None:
+        """Test that captured stderr is printed when cargo bench fails."""
+        completed = subprocess.CompletedProcess(args=["cargo"], returncode=101, stdout=None, stderr="error: could not compile")
+
+        with patch("performance_analysis.run_cargo_command", return_value=completed):
+            assert not PerformanceAnalyzer(tmp_path).run_benchmarks()
+
+        assert "error: could not compile" in capsys.readouterr().out
+
+
+class TestBaselineIO:
+    """Test cases for saving and loading baseline files."""
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_save_baseline_round_trips_through_load_baseline(self, tmp_path: Path) -> None:
+        """Test that a saved baseline loads back unchanged, by path and as the latest."""
+        analyzer = PerformanceAnalyzer(tmp_path)
+        results = {"group/bench": _estimate(123.5, 4.0), "group/other": _estimate(9.0)}
+
+        baseline_file = analyzer.save_baseline(results, tag="v1.2.3")
+
+        assert baseline_file.name.startswith("baseline_v1.2.3_")
+        assert analyzer.load_baseline(baseline_file) == results
+        assert analyzer.load_baseline() == results
+
+    def test_load_baseline_reuses_decoded_unchanged_file(self, tmp_path: Path, baseline_factory: BaselineFactory) -> None:
+        """Test that an unchanged baseline file is not decoded twice."""
+        baseline_file = baseline_factory("baseline_memo.json", {"bench": 100.0})
+        analyzer = PerformanceAnalyzer(tmp_path)
+        first = analyzer.load_baseline(baseline_file)
+
+        with patch("performance_analysis._load_json") as mock_load:
+            second = analyzer.load_baseline(baseline_file)
+
+        mock_load.assert_not_called()
+        assert second == first
+
+    def test_load_baseline_reloads_modified_file(self, tmp_path: Path, baseline_factory: BaselineFactory) -> None:
+        """Test that a modified baseline file is decoded again."""
+        baseline_file = baseline_factory("baseline_memo.json", {"bench": 100.0})
+        analyzer = PerformanceAnalyzer(tmp_path)
+        analyzer.load_baseline(baseline_file)
+
+        baseline_factory(baseline_file.name, {"bench": 250.0})
+        _bump_mtime(baseline_file)
+
+        assert analyzer.load_baseline(baseline_file)["bench"]["mean_ns"] == 250.0
+
+    def test_load_baseline_returns_independent_entries(self, tmp_path: Path, baseline_factory: BaselineFactory) -> None:
+        """Test that editing a loaded entry does not change later loads of the same file."""
+        baseline_file = baseline_factory("baseline_memo.json", {"bench": 100.0})
+        analyzer = PerformanceAnalyzer(tmp_path)
+
+        analyzer.load_baseline(baseline_file)["bench"]["median_ns"] = 1.0
+
+        assert analyzer.load_baseline(baseline_file)["bench"]["median_ns"] == 100.0
+
+    def test_load_baseline_warns_on_every_load_of_invalid_file(self, tmp_path: Path, capsys) -> None:
+        """Test that the invalid-entry warning is printed on each load, not only the first."""
+        baseline_file = tmp_path / "baseline_invalid.json"
+        baseline_file.write_text(json.dumps({"bench": {"mean_ns": 1.0}}), encoding="utf-8")
+        analyzer = PerformanceAnalyzer(tmp_path)
+
+        for _ in range(2):
+            assert analyzer.load_baseline(baseline_file) == {}
+            assert "Missing required keys" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        ("entry", "expected_warning"),
+        [
+            ({"mean_ns": 1.0, "std_dev_ns": 0.0, "median_ns": 1.0, "timestamp": "t"}, "Missing required keys"),
+            ({"mean_ns": "1", "std_dev_ns": 0.0, "median_ns": 1.0, "mad_ns": 0.0, "timestamp": "t"}, "Invalid 'mean_ns'"),
+            ({"mean_ns": 1.0, "std_dev_ns": 0.0, "median_ns": 1.0, "mad_ns": 0.0, "timestamp": 0}, "Invalid 'timestamp'"),
+            (
+                {"mean_ns": 1.0, "std_dev_ns": 0.0, "median_ns": 1.0, "mad_ns": 0.0, "timestamp": "t", "mean_ci_lower": None},
+                "Invalid 'mean_ci_lower'",
+            ),
+        ],
+    )
+    def test_load_baseline_rejects_invalid_entries(self, tmp_path: Path, capsys, entry: dict[str, object], expected_warning: str) -> None:
+        """Test that invalid legacy entries are rejected with a warning."""
+        baseline_file = tmp_path / "baseline_invalid.json"
+        baseline_file.write_text(json.dumps({"bench": entry}), encoding="utf-8")
+
+        assert PerformanceAnalyzer(tmp_path).load_baseline(baseline_file) == {}
+        assert expected_warning in capsys.readouterr().out
+
+    def test_load_baseline_accepts_confidence_intervals(self, tmp_path: Path) -> None:
+        """Test that optional confidence bounds pass validation."""
+        entry = {**_estimate(10.0), "mean_ci_lower": 9.0, "mean_ci_upper": 11}
+        baseline_file = tmp_path / "baseline_ci.json"
+        baseline_file.write_text(json.dumps({"bench": entry}), encoding="utf-8")
+
+        assert PerformanceAnalyzer(tmp_path).load_baseline(baseline_file) == {"bench": entry}
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_save_baseline_writes_sorted_keys(self, tmp_path: Path) -> None:
+        """Test that baselines are written indented, schema-marked and key-sorted."""
+        results = {"zeta": _estimate(1.0), "alpha": _estimate(2.0)}
+
+        baseline_file = PerformanceAnalyzer(tmp_path).save_baseline(results)
+
+        text = baseline_file.read_text(encoding="utf-8")
+        assert text.startswith('{\n  "_schema": 1,')
+        data = json.loads(text)
+        assert data["_schema"] == 1
+        assert list(data["entries"]) == ["alpha", "zeta"]
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_load_baseline_trusts_schema_marked_baselines(self, tmp_path: Path) -> None:
+        """Test that schema-marked baselines skip per-entry validation."""
+        analyzer = PerformanceAnalyzer(tmp_path)
+        baseline_file = analyzer.save_baseline({"bench": _estimate(5.0)})
+
+        with patch("performance_analysis._is_valid_baseline_entry") as mock_check:
+            loaded = analyzer.load_baseline(baseline_file)
+
+        mock_check.assert_not_called()
+        assert loaded == {"bench": _estimate(5.0)}